@@ -13,7 +13,7 @@ from app.config import settings
 from app.utils.llm_config import get_model_for_step
 
 
-async def get_cached_analysis(content_hash: str, prompt_type: str) -> Optional[Dict[str, Any]]:
+async def get_cached_analysis(content_hash: bytes, prompt_type: str) -> Optional[Dict[str, Any]]:
     """Check if we have cached LLM response for this content"""
     db = SessionLocal()
     try:
@@ -28,7 +28,7 @@ async def get_cached_analysis(content_hash: str, prompt_type: str) -> Optional[D
             cache_entry.last_used_at = datetime.utcnow()
             db.commit()
 
-            logger.info(f"Cache hit for {prompt_type}: {content_hash[:16]}...")
+            logger.info(f"Cache hit for {prompt_type}: {content_hash.hex()[:16]}...")
             return json.loads(cache_entry.response_json)
 
         return None
@@ -36,7 +36,7 @@ async def get_cached_analysis(content_hash: str, prompt_type: str) -> Optional[D
         db.close()
 
 
-async def cache_analysis(content_hash: str, prompt_type: str, response: Dict[str, Any], model_name: str):
+async def cache_analysis(content_hash: bytes, prompt_type: str, response: Dict[str, Any], model_name: str):
     """Cache LLM response"""
     db = SessionLocal()
     try:
@@ -48,7 +48,7 @@ async def cache_analysis(content_hash: str, prompt_type: str, response: Dict[str
         )
         db.add(cache_entry)
         db.commit()
-        logger.info(f"Cached {prompt_type} response: {content_hash[:16]}...")
+        logger.info(f"Cached {prompt_type} response: {content_hash.hex()[:16]}...")
     except Exception as e:
         logger.error(f"Error caching analysis: {e}")
         db.rollback()
@@ -69,7 +69,7 @@ async def analyzer_node(state: NewsProcessingState) -> NewsProcessingState:
         Updated state with analyzed content
     """
     stage_start = time.time()
-    logger.info(f"Analyzer node: Processing content (hash: {state['content_hash'][:16]}...)")
+    logger.info(f"Analyzer node: Processing content (hash: {state['content_hash'].hex()[:16]}...)")
 
     try:
         # Check cache first
@@ -78,8 +78,13 @@ async def article_fetcher_node(state: NewsProcessingState) -> NewsProcessingStat
                 except (ValueError, TypeError):
                     pass
         else:
-            # Website article → try lightweight HTTP fetch, then browser
-            lightweight_result = await rss_service.fetch_entry_content(article_url)
+            # Website article → try lightweight HTTP fetch, then browser.
+            # RSS sources already attempted it concurrently in the scraper node.
+            prefetched = state.get('prefetched_articles') or {}
+            if article_url in prefetched:
+                lightweight_result = prefetched.pop(article_url)
+            else:
+                lightweight_result = await rss_service.fetch_entry_content(article_url)
             if lightweight_result:
                 result = lightweight_result
                 logger.info(f"Article Fetcher: Lightweight HTTP fetch succeeded for {article_url}")
@@ -87,7 +92,9 @@ async def article_fetcher_node(state: NewsProcessingState) -> NewsProcessingStat
                 # Fall back to browser-based scraping
                 result = await web_scraper.scrape_url(
                     article_url,
-                    retry_on_403=True  # Enable retry for 403 errors
+                    retry_on_403=True,  # Enable retry for 403 errors
+                    return_html=False,  # Only listing pages need HTML (for link extraction)
+                    lean_html=True  # Only the article text is used
                 )
 
             if result['status'] != 'success':
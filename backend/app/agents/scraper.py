@@ -138,8 +138,11 @@ async def scraper_node(state: NewsProcessingState) -> NewsProcessingState:
                 state['metadata'] = result['metadata']
 
         elif state['source_type'] == 'rss':
-            # Fetch RSS feed - bypasses browser-based scraping entirely
-            result = await rss_service.fetch_feed(state['source_url'])
+            # Fetch RSS feed - bypasses browser-based scraping entirely.
+            # Article pages are fetched concurrently up front; the article
+            # fetcher only falls back to the browser for the ones that failed.
+            max_articles = state.get('max_articles', 20)
+            result = await rss_service.fetch_feed_with_content(state['source_url'], max_articles)
 
             if result['status'] != 'success':
                 state['errors'].append(f"RSS fetch failed: {result.get('error', 'Unknown error')}")
@@ -155,9 +158,9 @@ async def scraper_node(state: NewsProcessingState) -> NewsProcessingState:
                 return state
 
             # RSS provides article URLs directly - skip LLM-based link extraction
-            max_articles = state.get('max_articles', 20)
             state['is_listing_page'] = True
-            state['article_links'] = [entry['url'] for entry in entries if entry.get('url')][:max_articles]
+            state['article_links'] = [entry['url'] for entry in entries]
+            state['prefetched_articles'] = {entry['url']: entry['content'] for entry in entries}
             state['raw_content'] = f"RSS feed: {result.get('feed_title', '')} - {len(entries)} entries"
             state['metadata'] = {'feed_title': result.get('feed_title', ''), 'entry_count': len(entries)}
             state['stage'] = 'link_extraction_complete'
@@ -27,6 +27,7 @@ class NewsProcessingState(TypedDict):
     article_links: List[str]  # Extracted article URLs from listing page
     current_article_index: int  # Current article being processed
     processed_articles: List[Dict[str, Any]]  # Results of processed articles
+    prefetched_articles: Dict[str, Optional[Dict[str, Any]]]  # URL -> lightweight fetch result (RSS)
 
     # Analyzer output
     title: str
@@ -41,7 +42,7 @@ class NewsProcessingState(TypedDict):
     stock_mentions: List[Dict[str, Any]]  # List of stock mention dicts
 
     # Hashing
-    content_hash: str
+    content_hash: bytes  # Raw BLAKE3 digest of normalized content
 
     # Control flow
     stage: str  # Current processing stage
@@ -213,6 +213,7 @@ async def process_news_article(source_id: int, source_url: str, source_type: str
         'article_links': [],
         'current_article_index': 0,
         'processed_articles': [],
+        'prefetched_articles': {},
         'title': '',
         'content': '',
         'summary': None,
@@ -221,7 +222,7 @@ async def process_news_article(source_id: int, source_url: str, source_type: str
         'published_date': None,
         'is_high_impact': False,
         'stock_mentions': [],
-        'content_hash': '',
+        'content_hash': b'',
         'stage': 'init',
         'errors': [],
         'status': '',
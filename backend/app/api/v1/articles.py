@@ -1,16 +1,59 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, asc, case, func
+from sqlalchemy import Boolean, desc, asc, case, func, select
 from typing import Optional, List
 from datetime import datetime
 
 from app.database import get_db
-from app.models import NewsArticle, StockMention
+from app.models import NewsArticle, StockMention, DataSource
 from app.schemas import NewsArticleResponse, StockMentionResponse
+from app.schemas.article import NEWS_ARTICLE_LIST_ADAPTER, STOCK_MENTION_LIST_ADAPTER
 
 router = APIRouter(prefix="/articles", tags=["articles"])
 
 
+# List rows are fetched as plain columns (no ORM objects) and serialized by
+# pydantic-core in one pass, so the output matches response_model exactly
+_ARTICLE_COLUMNS = (
+    NewsArticle.id,
+    NewsArticle.data_source_id,
+    NewsArticle.url,
+    NewsArticle.title,
+    NewsArticle.content,
+    NewsArticle.summary,
+    NewsArticle.main_topic,
+    NewsArticle.author,
+    NewsArticle.published_date,
+    NewsArticle.fetched_at,
+    func.coalesce(NewsArticle.is_high_impact, False, type_=Boolean).label('is_high_impact'),
+    select(DataSource.name).where(DataSource.id == NewsArticle.data_source_id)
+    .scalar_subquery().label('source_name'),
+    select(DataSource.source_type).where(DataSource.id == NewsArticle.data_source_id)
+    .scalar_subquery().label('source_type'),
+)
+
+_STOCK_MENTION_COLUMNS = tuple(
+    getattr(StockMention, field) for field in StockMentionResponse.model_fields
+)
+
+
+def _stock_mentions_by_article(db: Session, article_ids: list[int]) -> dict[int, list]:
+    """Load the stock mentions for a page of articles in one query"""
+    mentions = {}
+    if not article_ids:
+        return mentions
+
+    rows = db.query(StockMention.article_id, *_STOCK_MENTION_COLUMNS).filter(
+        StockMention.article_id.in_(article_ids)
+    ).order_by(StockMention.id)
+
+    for row in rows:
+        values = row._asdict()
+        article_id = values.pop('article_id')
+        mentions.setdefault(article_id, []).append(StockMentionResponse.model_construct(**values))
+    return mentions
+
+
 @router.get("/", response_model=List[NewsArticleResponse])
 async def list_articles(
     page: int = Query(1, ge=1),
@@ -106,9 +149,14 @@ async def list_articles(
 
     # Apply pagination
     offset = (page - 1) * limit
-    articles = query.distinct().offset(offset).limit(limit).all()
+    rows = query.with_entities(*_ARTICLE_COLUMNS).distinct().offset(offset).limit(limit).all()
 
-    return articles
+    mentions = _stock_mentions_by_article(db, [row.id for row in rows])
+    articles = [
+        NewsArticleResponse.model_construct(**row._asdict(), stock_mentions=mentions.get(row.id, []))
+        for row in rows
+    ]
+    return Response(content=NEWS_ARTICLE_LIST_ADAPTER.dump_json(articles), media_type="application/json")
 
 
 @router.get("/{article_id}", response_model=NewsArticleResponse)
@@ -122,7 +170,10 @@ async def get_article(
     if not article:
         raise HTTPException(status_code=404, detail=f"Article {article_id} not found")
 
-    return article
+    return Response(
+        content=NewsArticleResponse.from_orm_trusted(article).model_dump_json(),
+        media_type="application/json"
+    )
 
 
 @router.get("/{article_id}/stocks", response_model=List[StockMentionResponse])
@@ -140,7 +191,8 @@ async def get_article_stocks(
         StockMention.article_id == article_id
     ).all()
 
-    return stocks
+    items = [StockMentionResponse.from_orm_trusted(stock) for stock in stocks]
+    return Response(content=STOCK_MENTION_LIST_ADAPTER.dump_json(items), media_type="application/json")
 
 
 @router.delete("/{article_id}", status_code=204)
@@ -1,16 +1,30 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 from typing import Dict, List
 import json
+import orjson
 
 from app.database import get_db
 from app.models import SystemConfig
 from app.services.ollama import ollama_service
+from app.utils.llm_config import invalidate_llm_config_cache
 
 router = APIRouter(prefix="/config", tags=["config"])
 
+# Bumped on every write to the llm_config row. GET /config/llm reuses its
+# serialized body while the version and the installed models are unchanged.
+_CONFIG_VERSION = 0
+_CONFIG_CACHE: tuple[int, tuple, bytes] = (-1, (), b'')
+
+
+def _bump_config_version():
+    global _CONFIG_VERSION
+    _CONFIG_VERSION += 1
+    # Workflow steps read model assignments through their own cache
+    invalidate_llm_config_cache()
+
 
 class LLMConfigUpdate(BaseModel):
     """Request model for updating LLM configuration"""
@@ -37,6 +51,11 @@ async def get_llm_config(db: Session = Depends(get_db)):
     # Extract model names
     available_models = [model.get("name", "").replace(":latest", "") for model in models]
 
+    global _CONFIG_CACHE
+    version, cached_models, body = _CONFIG_CACHE
+    if version == _CONFIG_VERSION and cached_models == tuple(available_models):
+        return Response(content=body, media_type="application/json")
+
     # Get or create config
     config = db.query(SystemConfig).filter(SystemConfig.key == "llm_config").first()
 
@@ -61,13 +80,16 @@ async def get_llm_config(db: Session = Depends(get_db)):
         db.add(config)
         db.commit()
         db.refresh(config)
+        _bump_config_version()
 
     config_data = json.loads(config.value)
 
     # Always return current installed models from Ollama
     config_data["available_models"] = available_models
 
-    return config_data
+    body = orjson.dumps(config_data)
+    _CONFIG_CACHE = (_CONFIG_VERSION, tuple(available_models), body)
+    return Response(content=body, media_type="application/json")
 
 
 @router.put("/llm")
@@ -90,6 +112,7 @@ async def update_llm_config(
     config.value = json.dumps(config_data)
     db.commit()
     db.refresh(config)
+    _bump_config_version()
 
     return json.loads(config.value)
 
@@ -155,6 +178,8 @@ async def delete_model(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                     detail=f"Failed to delete model from Ollama: {response.text}"
                 )
+
+        ollama_service.invalidate_tags_cache()
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -178,5 +203,6 @@ async def delete_model(
 
             config.value = json.dumps(config_data)
             db.commit()
+            _bump_config_version()
 
     return {"message": f"Model {model_name} deleted successfully"}
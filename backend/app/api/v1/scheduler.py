@@ -26,19 +26,16 @@ class SchedulerStatusResponse(BaseModel):
 @router.get("/status", response_model=SchedulerStatusResponse)
 async def get_scheduler_status(db: Session = Depends(get_db)):
     """Get scheduler status"""
-    all_jobs = scheduler_service.get_all_jobs()
+    total_jobs, source_jobs = scheduler_service.count_jobs()
 
     # Get global pause setting
     config = db.query(SystemConfig).filter(SystemConfig.key == 'global_pause').first()
     global_pause = config.value.lower() in ('true', '1', 'yes') if config else False
 
-    # Count active jobs (source jobs only)
-    source_jobs = [j for j in all_jobs if j['id'].startswith('source_')]
-
     return SchedulerStatusResponse(
         is_running=scheduler_service.is_running,
-        total_jobs=len(all_jobs),
-        active_jobs=len(source_jobs),
+        total_jobs=total_jobs,
+        active_jobs=source_jobs,  # Active jobs are source jobs only
         paused_jobs=0,  # APScheduler doesn't track paused state easily
         global_pause=global_pause
     )
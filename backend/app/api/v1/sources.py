@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List
@@ -38,10 +38,11 @@ async def list_sources(
     total = query.count()
     sources = query.offset(skip).limit(limit).all()
 
-    return DataSourceListResponse(
-        sources=sources,
+    payload = DataSourceListResponse.model_construct(
+        sources=[DataSourceResponse.from_db(source) for source in sources],
         total=total
     )
+    return Response(content=payload.model_dump_json(), media_type="application/json")
 
 
 @router.post("/", response_model=DataSourceResponse, status_code=status.HTTP_201_CREATED)
@@ -106,7 +107,7 @@ async def get_source(
             detail=f"Data source {source_id} not found"
         )
 
-    return source
+    return Response(content=DataSourceResponse.from_db(source).model_dump_json(), media_type="application/json")
 
 
 @router.put("/{source_id}", response_model=DataSourceResponse)
@@ -244,6 +245,7 @@ async def test_source(
                 'article_links': [],
                 'current_article_index': 0,
                 'processed_articles': [],
+                'prefetched_articles': {},
                 'title': '',
                 'content': '',
                 'summary': None,
@@ -252,7 +254,7 @@ async def test_source(
                 'published_date': None,
                 'is_high_impact': False,
                 'stock_mentions': [],
-                'content_hash': '',
+                'content_hash': b'',
                 'stage': 'init',
                 'errors': [],
                 'status': '',
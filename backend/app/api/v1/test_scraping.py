@@ -51,7 +51,7 @@ async def test_scrape(request: ScrapeTestRequest):
                 status='success',
                 url=request.url,
                 content_preview=raw_content[:500] + '...' if len(raw_content) > 500 else raw_content,
-                content_hash=content_hash,
+                content_hash=content_hash.hex(),
                 metadata=result['metadata'],
                 content_length=len(raw_content)
             )
@@ -74,7 +74,7 @@ async def test_scrape(request: ScrapeTestRequest):
                 status='success',
                 url=request.url,
                 content_preview=transcript[:500] + '...' if len(transcript) > 500 else transcript,
-                content_hash=content_hash,
+                content_hash=content_hash.hex(),
                 metadata=result['metadata'],
                 content_length=len(transcript)
             )
@@ -41,6 +41,9 @@ class Settings(BaseSettings):
     STEALTH_ENABLED: bool = True
     HUMAN_BEHAVIOR_ENABLED: bool = True
     USER_AGENT_ROTATION: bool = True
+    BLOCK_HEAVY_RESOURCES: bool = True        # Abort image/media/font/stylesheet requests (not when screenshotting)
+    SCRAPER_MIN_HOST_INTERVAL: float = 2.0    # Min seconds between page loads on the same host
+    BROWSER_CONTEXT_POOL_SIZE: int = 2        # Browser contexts (UA + proxy identities) scrapes rotate through
 
     # Proxy (optional)
     PROXY_URL: Optional[str] = None
@@ -51,6 +54,7 @@ class Settings(BaseSettings):
     # RSS
     RSS_ENABLED: bool = True
     RSS_REQUEST_TIMEOUT: int = 30
+    RSS_FETCH_CONCURRENCY: int = 8            # Parallel lightweight article fetches per feed
 
     # Cloudflare Bypass
     CLOUDFLARE_BYPASS_ENABLED: bool = True    # Master switch for Cloudflare bypass
@@ -1,8 +1,13 @@
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from typing import Generator
 from app.config import settings
+from app.utils.content_hash import sql_content_digest
+
+# Bump whenever models or init_db migrations change. Stored in SQLite's
+# PRAGMA user_version so startup can skip schema introspection when current.
+SCHEMA_VERSION = 7
 
 # Create SQLite engine
 engine = create_engine(
@@ -19,6 +24,9 @@ def set_sqlite_pragma(dbapi_conn, connection_record):
     cursor.execute("PRAGMA foreign_keys=ON")
     cursor.close()
 
+    # content_digest(text) -> BLAKE3 of normalized text, for in-SQL rehashing
+    dbapi_conn.create_function("content_digest", 1, sql_content_digest, deterministic=True)
+
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -38,8 +46,28 @@ def get_db() -> Generator:
         db.close()
 
 
+def get_schema_version() -> int:
+    """
+    Read the schema version stamped on the database file
+    """
+    with engine.connect() as conn:
+        return conn.execute(text("PRAGMA user_version")).scalar() or 0
+
+
+def set_schema_version(version: int = SCHEMA_VERSION):
+    """
+    Stamp the database file with a schema version
+    """
+    with engine.connect() as conn:
+        conn.execute(text(f"PRAGMA user_version = {int(version)}"))
+        conn.commit()
+
+
 def init_db():
     """
     Initialize database - create all tables
     """
+    if get_schema_version() == SCHEMA_VERSION:
+        return
+
     Base.metadata.create_all(bind=engine)
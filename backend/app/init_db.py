@@ -2,14 +2,15 @@
 Database initialization script
 Creates all tables and inserts default configuration
 """
-from app.database import engine, Base, SessionLocal
+from app.database import engine, Base, SessionLocal, SCHEMA_VERSION, get_schema_version, set_schema_version
 from app.models import DataSource, NewsArticle, StockMention, ProcessingLog, SystemConfig, LLMCache
 from loguru import logger
 
 
 def migrate_source_type_constraint():
-    """Migrate data_sources table to add 'rss' to source_type check constraint
-    and fix any column misalignment from previous migrations.
+    """Migrate data_sources table to add 'rss' to source_type check constraint,
+    make check_fetch_status NULL-safe, and fix any column misalignment from
+    previous migrations.
 
     Background: extraction_instructions was added via ALTER TABLE ADD COLUMN,
     which puts it at the END in SQLite (after created_at, updated_at). A prior
@@ -41,14 +42,13 @@ def migrate_source_type_constraint():
         except Exception:
             pass
 
-        # Check if constraint migration is needed
-        needs_constraint = False
+        # Check if constraint migration is needed: source_type without 'rss',
+        # or the check_fetch_status from before it was made NULL-safe
         result = conn.execute(text(
             "SELECT sql FROM sqlite_master WHERE type='table' AND name='data_sources'"
         ))
         ddl = result.scalar() or ""
-        if "'rss'" not in ddl:
-            needs_constraint = True
+        needs_constraint = "'rss'" not in ddl or "last_fetch_status IS NULL OR" not in ddl
 
         if not needs_constraint and not needs_data_repair:
             logger.info("data_sources table is up to date, skipping migration")
@@ -56,6 +56,11 @@ def migrate_source_type_constraint():
 
         logger.info(f"Migrating data_sources (constraint={needs_constraint}, repair={needs_data_repair})...")
 
+        # Keep max_articles when the table already has it (added by
+        # migrate_add_max_articles on earlier upgrades)
+        columns = {column['name'] for column in inspector.get_columns('data_sources')}
+        max_articles = "max_articles" if "max_articles" in columns else "NULL"
+
         conn.execute(text("PRAGMA foreign_keys=OFF"))
 
         conn.execute(text("""
@@ -76,10 +81,11 @@ def migrate_source_type_constraint():
                 extraction_instructions TEXT,
                 created_at DATETIME DEFAULT (CURRENT_TIMESTAMP),
                 updated_at DATETIME DEFAULT (CURRENT_TIMESTAMP),
+                max_articles INTEGER,
                 CONSTRAINT check_source_type CHECK (source_type IN ('website', 'youtube', 'rss')),
                 CONSTRAINT check_status CHECK (status IN ('active', 'paused', 'deleted')),
                 CONSTRAINT check_health_status CHECK (health_status IN ('healthy', 'pending', 'error')),
-                CONSTRAINT check_fetch_status CHECK (last_fetch_status IN ('success', 'error', 'captcha', 'timeout'))
+                CONSTRAINT check_fetch_status CHECK (last_fetch_status IS NULL OR last_fetch_status IN ('success', 'error', 'timeout', 'captcha'))
             )
         """))
 
@@ -87,38 +93,38 @@ def migrate_source_type_constraint():
             # Columns are scrambled: extraction_instructions holds created_at,
             # created_at holds updated_at, updated_at holds extraction_instructions.
             # Swap them back to correct positions.
-            conn.execute(text("""
+            conn.execute(text(f"""
                 INSERT INTO data_sources_new (
                     id, name, url, source_type, status, health_status,
                     fetch_frequency_minutes, cron_expression,
                     last_fetch_timestamp, last_fetch_status,
                     error_message, error_count, config_json,
-                    extraction_instructions, created_at, updated_at
+                    extraction_instructions, created_at, updated_at, max_articles
                 )
                 SELECT
                     id, name, url, source_type, status, health_status,
                     fetch_frequency_minutes, cron_expression,
                     last_fetch_timestamp, last_fetch_status,
                     error_message, error_count, config_json,
-                    updated_at, extraction_instructions, created_at
+                    updated_at, extraction_instructions, created_at, {max_articles}
                 FROM data_sources
             """))
         else:
             # Columns are fine, just copy with explicit names
-            conn.execute(text("""
+            conn.execute(text(f"""
                 INSERT INTO data_sources_new (
                     id, name, url, source_type, status, health_status,
                     fetch_frequency_minutes, cron_expression,
                     last_fetch_timestamp, last_fetch_status,
                     error_message, error_count, config_json,
-                    extraction_instructions, created_at, updated_at
+                    extraction_instructions, created_at, updated_at, max_articles
                 )
                 SELECT
                     id, name, url, source_type, status, health_status,
                     fetch_frequency_minutes, cron_expression,
                     last_fetch_timestamp, last_fetch_status,
                     error_message, error_count, config_json,
-                    extraction_instructions, created_at, updated_at
+                    extraction_instructions, created_at, updated_at, {max_articles}
                 FROM data_sources
             """))
 
@@ -149,18 +155,135 @@ def migrate_add_max_articles():
         logger.info("Added max_articles column to data_sources")
 
 
+def migrate_add_active_sources_index():
+    """Create the partial index on active data sources if it doesn't exist.
+
+    create_all() only builds indexes for tables it creates, so existing
+    databases (and tables rebuilt by migrate_source_type_constraint) need it added here.
+    """
+    from sqlalchemy import text, inspect
+
+    inspector = inspect(engine)
+    if 'data_sources' not in inspector.get_table_names():
+        return  # Table will be created fresh by create_all()
+
+    indexes = [index['name'] for index in inspector.get_indexes('data_sources')]
+    if 'ix_data_sources_active_fetch' in indexes:
+        logger.info("ix_data_sources_active_fetch already exists, skipping migration")
+        return
+
+    with engine.connect() as conn:
+        conn.execute(text(
+            "CREATE INDEX ix_data_sources_active_fetch "
+            "ON data_sources (last_fetch_timestamp) WHERE status = 'active'"
+        ))
+        conn.commit()
+        logger.info("Added partial index ix_data_sources_active_fetch to data_sources")
+
+
+def migrate_drop_redundant_pk_indexes():
+    """Drop the secondary indexes on INTEGER PRIMARY KEY columns of append-heavy tables.
+
+    The id column is already SQLite's rowid, so ix_<table>_id duplicated the
+    table's own B-tree and cost an extra index write on every insert.
+    """
+    from sqlalchemy import text
+
+    with engine.connect() as conn:
+        for table in ('news_articles', 'processing_logs', 'stock_mentions', 'llm_cache'):
+            conn.execute(text(f"DROP INDEX IF EXISTS ix_{table}_id"))
+        conn.commit()
+
+
+def migrate_content_hash_to_binary():
+    """Rewrite hex-encoded content_hash values as raw 32-byte SHA-256 digests.
+
+    content_hash used to be stored as a 64-char hex string. The columns are now
+    LargeBinary(32); SQLite keeps the declared column type as-is, so only the
+    stored values need converting. Rows already holding a BLOB are left alone.
+    """
+    from sqlalchemy import text, inspect
+
+    inspector = inspect(engine)
+    existing_tables = inspector.get_table_names()
+
+    with engine.connect() as conn:
+        for table in ('news_articles', 'llm_cache'):
+            if table not in existing_tables:
+                continue  # Table will be created fresh by create_all()
+
+            rows = conn.execute(text(
+                f"SELECT id, content_hash FROM {table} WHERE typeof(content_hash) = 'text'"
+            )).fetchall()
+
+            if not rows:
+                logger.info(f"{table}.content_hash already binary, skipping migration")
+                continue
+
+            logger.info(f"Converting {len(rows)} hex content hashes in {table} to binary...")
+            conn.execute(
+                text(f"UPDATE {table} SET content_hash = :content_hash WHERE id = :id"),
+                [{"id": row_id, "content_hash": bytes.fromhex(value)} for row_id, value in rows]
+            )
+
+        conn.commit()
+
+
+def migrate_rehash_content_blake3(current_version: int):
+    """Recompute news_articles.content_hash with BLAKE3 (schema version 4).
+
+    Hashes were SHA-256 before version 4. Articles are rehashed in SQL via the
+    content_digest() function registered in database.py. LLM cache rows can't
+    be rehashed (the source text isn't stored) and would never be hit again,
+    so they are dropped, with a warning (see the upgrade notes in DEPLOYMENT.md).
+    """
+    from sqlalchemy import text, inspect
+
+    if current_version >= 4:
+        return
+
+    inspector = inspect(engine)
+    existing_tables = inspector.get_table_names()
+
+    with engine.connect() as conn:
+        if 'news_articles' in existing_tables:
+            result = conn.execute(text(
+                "UPDATE news_articles SET content_hash = content_digest(content)"
+            ))
+            logger.info(f"Rehashed {result.rowcount} articles with BLAKE3")
+
+        if 'llm_cache' in existing_tables:
+            result = conn.execute(text("DELETE FROM llm_cache"))
+            if result.rowcount:
+                logger.warning(
+                    f"Dropped {result.rowcount} SHA-256 keyed LLM cache entries; "
+                    f"responses will be recomputed by Ollama (see DEPLOYMENT.md upgrade notes)"
+                )
+
+        conn.commit()
+
+
 def init_database():
     """Initialize database with tables and default config"""
-    logger.info("Creating database tables...")
+    current_version = get_schema_version()
+    if current_version == SCHEMA_VERSION:
+        logger.info(f"Database schema up to date (version {SCHEMA_VERSION}), skipping migrations")
+    else:
+        logger.info(f"Creating database tables (schema version {current_version} -> {SCHEMA_VERSION})...")
 
-    # Run migrations before create_all
-    migrate_source_type_constraint()
-    migrate_add_max_articles()
+        # Run migrations before create_all
+        migrate_source_type_constraint()
+        migrate_add_max_articles()
+        migrate_add_active_sources_index()
+        migrate_drop_redundant_pk_indexes()
+        migrate_content_hash_to_binary()
+        migrate_rehash_content_blake3(current_version)
 
-    # Create all tables
-    Base.metadata.create_all(bind=engine)
+        # Create all tables
+        Base.metadata.create_all(bind=engine)
+        set_schema_version()
 
-    logger.info("Database tables created successfully")
+        logger.info("Database tables created successfully")
 
     # Insert default system configuration
     db = SessionLocal()
@@ -1,6 +1,7 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import asyncio
 from loguru import logger
 
 from app.config import settings
@@ -13,15 +14,19 @@ from app.api.v1 import sources, health, test_scraping, process, scheduler, artic
 async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting Stock News API...")
-    logger.info(f"Initializing database at {settings.DATABASE_URL}")
-    init_db()
-    logger.info("Database initialized successfully")
-
-    # Initialize and start scheduler
     from app.scheduler import scheduler_service
-    logger.info("Initializing scheduler...")
-    scheduler_service.initialize()
-    scheduler_service.start()
+
+    # Database init and scheduler setup are independent (the job store lives
+    # in its own SQLite file), so run them concurrently in worker threads
+    logger.info(f"Initializing database at {settings.DATABASE_URL} and scheduler...")
+    await asyncio.gather(
+        asyncio.to_thread(init_db),
+        asyncio.to_thread(scheduler_service.initialize),
+    )
+    logger.info("Database and scheduler initialized successfully")
+
+    # Starting loads source jobs from the database, so it must follow init_db
+    await scheduler_service.start()
     logger.info("Scheduler started successfully")
 
     yield
@@ -32,6 +37,10 @@ async def lifespan(app: FastAPI):
     scheduler_service.shutdown()
     logger.info("Scheduler stopped")
 
+    from app.services import ollama_service, rss_service
+    await ollama_service.aclose()
+    await rss_service.aclose()
+
 
 # Create FastAPI application
 app = FastAPI(
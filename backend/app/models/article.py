@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, ForeignKey, LargeBinary
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -7,17 +7,17 @@ from app.database import Base
 class NewsArticle(Base):
     __tablename__ = "news_articles"
 
-    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    id = Column(Integer, primary_key=True, autoincrement=True)  # rowid alias, no separate index
     data_source_id = Column(Integer, ForeignKey('data_sources.id', ondelete='CASCADE'), nullable=False, index=True)
-    url = Column(String, nullable=False)
-    title = Column(String, nullable=False)
+    url = Column(String(2048), nullable=False)
+    title = Column(String(1024), nullable=False)
     content = Column(Text, nullable=False)
     summary = Column(Text, nullable=True)
     main_topic = Column(String, nullable=True)
     author = Column(String, nullable=True)
     published_date = Column(DateTime, nullable=True, index=True)
     fetched_at = Column(DateTime, nullable=False, server_default=func.now(), index=True)
-    content_hash = Column(String, nullable=False, unique=True)
+    content_hash = Column(LargeBinary(32), nullable=False, unique=True)  # raw BLAKE3 digest
     is_high_impact = Column(Boolean, default=False)
     raw_metadata_json = Column(Text, nullable=True)
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, CheckConstraint
+from sqlalchemy import Column, Integer, String, DateTime, Text, CheckConstraint, Index, text
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -28,5 +28,12 @@ class DataSource(Base):
         CheckConstraint("source_type IN ('website', 'youtube', 'rss')", name='check_source_type'),
         CheckConstraint("status IN ('active', 'paused', 'deleted')", name='check_status'),
         CheckConstraint("health_status IN ('healthy', 'pending', 'error')", name='check_health_status'),
-        CheckConstraint("last_fetch_status IN ('success', 'error', 'captcha', 'timeout')", name='check_fetch_status'),
+        # Nullable column: accept NULL explicitly, values ordered by how often they occur
+        CheckConstraint(
+            "last_fetch_status IS NULL OR last_fetch_status IN ('success', 'error', 'timeout', 'captcha')",
+            name='check_fetch_status'
+        ),
+        # Partial index: only active sources are scanned by the scheduler,
+        # so paused/deleted rows never bloat it
+        Index('ix_data_sources_active_fetch', 'last_fetch_timestamp', sqlite_where=text("status = 'active'")),
     )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text
+from sqlalchemy import Column, Integer, String, DateTime, Text, LargeBinary
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -6,8 +6,8 @@ from app.database import Base
 class LLMCache(Base):
     __tablename__ = "llm_cache"
 
-    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    content_hash = Column(String, nullable=False, unique=True, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True)  # rowid alias, no separate index
+    content_hash = Column(LargeBinary(32), nullable=False, unique=True, index=True)  # raw BLAKE3 digest
     model_name = Column(String, nullable=False)
     prompt_type = Column(String, nullable=False, index=True)
     response_json = Column(Text, nullable=False)
@@ -7,7 +7,7 @@ from app.database import Base
 class ProcessingLog(Base):
     __tablename__ = "processing_logs"
 
-    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    id = Column(Integer, primary_key=True, autoincrement=True)  # rowid alias, no separate index
     article_id = Column(Integer, ForeignKey('news_articles.id', ondelete='CASCADE'), nullable=True)
     data_source_id = Column(Integer, ForeignKey('data_sources.id', ondelete='CASCADE'), nullable=True)
     stage = Column(String, nullable=False)
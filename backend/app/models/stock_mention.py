@@ -6,7 +6,7 @@ from app.database import Base
 class StockMention(Base):
     __tablename__ = "stock_mentions"
 
-    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    id = Column(Integer, primary_key=True, autoincrement=True)  # rowid alias, no separate index
     article_id = Column(Integer, ForeignKey('news_articles.id', ondelete='CASCADE'), nullable=False, index=True)
     ticker_symbol = Column(String, nullable=False, index=True)
     company_name = Column(String, nullable=False)
@@ -1,10 +1,12 @@
 import asyncio
 from datetime import datetime, timedelta
 from loguru import logger
+from typing import Optional
+from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
 
 from app.database import SessionLocal
-from app.models import DataSource, NewsArticle, SystemConfig
+from app.models import DataSource, NewsArticle, SystemConfig, LLMCache
 from app.agents import process_news_article
 from app.services import ollama_service
 
@@ -12,6 +14,9 @@ from app.services import ollama_service
 # Semaphore for concurrent fetch limiting
 fetch_semaphore = None
 
+# Rows deleted per transaction by the cleanup jobs
+CLEANUP_BATCH_SIZE = 1000
+
 
 def init_fetch_semaphore(max_concurrent: int):
     """Initialize the fetch semaphore"""
@@ -37,93 +42,155 @@ def get_config_value(key: str, default: any, db: Session) -> any:
         return config.value
 
 
+def _load_source_for_fetch(source_id: int) -> Optional[DataSource]:
+    """
+    Load a data source for fetch_source_job (runs in a worker thread)
+
+    Uses its own session; the returned instance is detached with all
+    columns loaded.
+
+    Returns:
+        The DataSource, or None if it should be skipped
+        (missing, not active, or global pause enabled)
+    """
+    db = SessionLocal(expire_on_commit=False)
+    try:
+        source = db.query(DataSource).filter(DataSource.id == source_id).first()
+        if not source:
+            logger.warning(f"Source {source_id} not found, skipping")
+            return None
+
+        # Check if source is active
+        if source.status != 'active':
+            logger.info(f"Source {source_id} is {source.status}, skipping")
+            return None
+
+        # Check global pause
+        global_pause = get_config_value('global_pause', False, db)
+        if global_pause:
+            logger.info(f"Global pause is active, skipping source {source_id}")
+            return None
+
+        return source
+    finally:
+        db.close()
+
+
+def _record_fetch_error(source_id: int, message: str):
+    """Count a failed fetch attempt on a data source (runs in a worker thread)"""
+    db = SessionLocal()
+    try:
+        source = db.query(DataSource).filter(DataSource.id == source_id).first()
+        if not source:
+            return
+        source.error_count += 1
+        source.last_fetch_status = 'error'
+        source.error_message = message
+        db.commit()
+    finally:
+        db.close()
+
+
+def _auto_disable_if_failing(source_id: int):
+    """Pause a data source once its error count reaches the threshold (runs in a worker thread)"""
+    db = SessionLocal()
+    try:
+        # Fresh read: the workflow's error handler has updated the error count
+        source = db.query(DataSource).filter(DataSource.id == source_id).first()
+        if not source:
+            return
+
+        auto_disable_threshold = get_config_value('auto_disable_threshold', 5, db)
+
+        if source.error_count >= auto_disable_threshold:
+            logger.warning(
+                f"Source {source_id} reached error threshold ({source.error_count}), "
+                f"auto-disabling"
+            )
+            source.status = 'paused'
+            db.commit()
+
+            # TODO: Send WebSocket notification about auto-disable
+    finally:
+        db.close()
+
+
 async def fetch_source_job(source_id: int):
     """
     Job to fetch and process a single data source
 
+    All ORM work runs in worker threads, each with its own session, so the
+    event loop never blocks on SQLite.
+
     Args:
         source_id: ID of the data source to process
     """
     # Use semaphore to limit concurrent fetches
     async with fetch_semaphore:
-        db = SessionLocal()
-        try:
-            # Get the source
-            source = db.query(DataSource).filter(DataSource.id == source_id).first()
-            if not source:
-                logger.warning(f"Source {source_id} not found, skipping")
-                return
-
-            # Check if source is active
-            if source.status != 'active':
-                logger.info(f"Source {source_id} is {source.status}, skipping")
-                return
-
-            # Check global pause
-            global_pause = get_config_value('global_pause', False, db)
-            if global_pause:
-                logger.info(f"Global pause is active, skipping source {source_id}")
-                return
-
-            # Check Ollama health before starting
-            is_healthy = await ollama_service.check_health()
-            if not is_healthy:
-                logger.error(f"Ollama is unavailable, skipping source {source_id}")
-                # Increment error count
-                source.error_count += 1
-                source.last_fetch_status = 'error'
-                source.error_message = 'Ollama unavailable'
-                db.commit()
-                return
-
-            logger.info(f"Starting scheduled fetch for source {source_id}: {source.name}")
-
-            # Store source data before closing DB session
-            source_url = source.url
-            source_type = source.source_type
-            extraction_instructions = source.extraction_instructions
-            max_articles = source.max_articles
-
-        finally:
-            db.close()
-
-        # Run the workflow (outside of db session to avoid conflicts)
+        # Load the source while the Ollama health check is in flight
+        source, is_healthy = await asyncio.gather(
+            asyncio.to_thread(_load_source_for_fetch, source_id),
+            ollama_service.check_health(),
+        )
+
+        if source is None:
+            return
+
+        if not is_healthy:
+            logger.error(f"Ollama is unavailable, skipping source {source_id}")
+            await asyncio.to_thread(_record_fetch_error, source_id, 'Ollama unavailable')
+            return
+
+        logger.info(f"Starting scheduled fetch for source {source_id}: {source.name}")
+
+        # Run the workflow (it writes through its own sessions)
         result = await process_news_article(
             source_id=source_id,
-            source_url=source_url,
-            source_type=source_type,
-            extraction_instructions=extraction_instructions,
-            max_articles=max_articles
+            source_url=source.url,
+            source_type=source.source_type,
+            extraction_instructions=source.extraction_instructions,
+            max_articles=source.max_articles
         )
 
-        # Handle auto-disable
-        db = SessionLocal()
-        try:
-            source = db.query(DataSource).filter(DataSource.id == source_id).first()
-            if not source:
-                return
+        if result['status'] == 'success' or result['status'] == 'skipped':
+            logger.info(f"Source {source_id} processed successfully: {result['stage']}")
+            return
 
-            if result['status'] == 'success' or result['status'] == 'skipped':
-                logger.info(f"Source {source_id} processed successfully: {result['stage']}")
-            else:
-                # Check if we should auto-disable
-                auto_disable_threshold = get_config_value('auto_disable_threshold', 5, db)
+        # Check if we should auto-disable
+        await asyncio.to_thread(_auto_disable_if_failing, source_id)
 
-                if source.error_count >= auto_disable_threshold:
-                    logger.warning(
-                        f"Source {source_id} reached error threshold ({source.error_count}), "
-                        f"auto-disabling"
-                    )
-                    source.status = 'paused'
-                    db.commit()
 
-                    # TODO: Send WebSocket notification about auto-disable
+def _delete_in_batches(db: Session, model, timestamp_column, cutoff_date: datetime) -> int:
+    """
+    Delete rows older than cutoff_date in chunks of CLEANUP_BATCH_SIZE,
+    committing after each chunk so no single transaction holds the write lock for long
 
-        finally:
-            db.close()
+    Args:
+        model: ORM model whose table is purged
+        timestamp_column: Column compared against cutoff_date
+        cutoff_date: Rows older than this are deleted
+
+    Returns:
+        Total number of rows deleted
+    """
+    batch_ids = (
+        select(model.id)
+        .where(timestamp_column < cutoff_date)
+        .limit(CLEANUP_BATCH_SIZE)
+        .scalar_subquery()
+    )
+    statement = delete(model).where(model.id.in_(batch_ids))
+
+    total = 0
+    while True:
+        deleted = db.execute(statement, execution_options={"synchronize_session": False}).rowcount
+        db.commit()
+        total += deleted
+        if deleted < CLEANUP_BATCH_SIZE:
+            return total
 
 
-async def cleanup_old_articles_job():
+def cleanup_old_articles_job():
     """
     Job to clean up old articles based on retention policy
     """
@@ -136,22 +203,14 @@ async def cleanup_old_articles_job():
         retention_days = get_config_value('data_retention_days', app_settings.DATA_RETENTION_DAYS, db)
         cutoff_date = datetime.utcnow() - timedelta(days=retention_days)
 
-        # Find old articles
-        old_articles = db.query(NewsArticle).filter(
-            NewsArticle.fetched_at < cutoff_date
-        ).all()
+        # Delete in batches, committing between them to keep each write
+        # transaction short (ON DELETE CASCADE handles stock_mentions and processing_logs)
+        count = _delete_in_batches(db, NewsArticle, NewsArticle.fetched_at, cutoff_date)
 
-        if not old_articles:
+        if not count:
             logger.info("No articles to clean up")
             return
 
-        # Delete them (cascade will handle stock_mentions and processing_logs)
-        count = len(old_articles)
-        for article in old_articles:
-            db.delete(article)
-
-        db.commit()
-
         logger.info(f"Cleaned up {count} articles older than {retention_days} days")
 
     except Exception as e:
@@ -161,7 +220,7 @@ async def cleanup_old_articles_job():
         db.close()
 
 
-async def cleanup_old_cache_job():
+def cleanup_old_cache_job():
     """
     Job to clean up old LLM cache entries
     """
@@ -169,28 +228,17 @@ async def cleanup_old_cache_job():
 
     db = SessionLocal()
     try:
-        from app.models import LLMCache
-
         # Get retention days from config
         from app.config import settings as app_settings
         retention_days = get_config_value('data_retention_days', app_settings.DATA_RETENTION_DAYS, db)
         cutoff_date = datetime.utcnow() - timedelta(days=retention_days)
 
-        # Find old cache entries
-        old_cache = db.query(LLMCache).filter(
-            LLMCache.created_at < cutoff_date
-        ).all()
+        count = _delete_in_batches(db, LLMCache, LLMCache.created_at, cutoff_date)
 
-        if not old_cache:
+        if not count:
             logger.info("No cache entries to clean up")
             return
 
-        count = len(old_cache)
-        for cache in old_cache:
-            db.delete(cache)
-
-        db.commit()
-
         logger.info(f"Cleaned up {count} cache entries older than {retention_days} days")
 
     except Exception as e:
@@ -198,21 +246,3 @@ async def cleanup_old_cache_job():
         db.rollback()
     finally:
         db.close()
-
-
-def sync_fetch_source_job(source_id: int):
-    """
-    Synchronous wrapper for fetch_source_job
-    APScheduler needs synchronous functions
-    """
-    asyncio.run(fetch_source_job(source_id))
-
-
-def sync_cleanup_articles_job():
-    """Synchronous wrapper for cleanup job"""
-    asyncio.run(cleanup_old_articles_job())
-
-
-def sync_cleanup_cache_job():
-    """Synchronous wrapper for cache cleanup job"""
-    asyncio.run(cleanup_old_cache_job())
@@ -1,22 +1,39 @@
+import asyncio
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.schedulers.base import STATE_RUNNING
 from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.executors.asyncio import AsyncIOExecutor
 from apscheduler.executors.pool import ThreadPoolExecutor
+from apscheduler.jobstores.base import JobLookupError
 from loguru import logger
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from app.config import settings
 from app.database import SessionLocal
 from app.models import DataSource
 from app.scheduler.jobs import (
-    sync_fetch_source_job,
-    sync_cleanup_articles_job,
-    sync_cleanup_cache_job,
+    fetch_source_job,
+    cleanup_old_articles_job,
+    cleanup_old_cache_job,
     init_fetch_semaphore
 )
 
+_UTC = timezone.utc
+
+
+@lru_cache(maxsize=512)
+def _parse_cron(expr: str) -> CronTrigger:
+    """Parse a crontab expression, memoized since many sources share schedules.
+
+    CronTrigger is immutable once built, so jobs can share one instance.
+    """
+    return CronTrigger.from_crontab(expr)
+
 
 class SchedulerService:
     """Service for managing the APScheduler instance and jobs"""
@@ -38,9 +55,14 @@ class SchedulerService:
             'default': SQLAlchemyJobStore(url=settings.SCHEDULER_DB_URL)
         }
 
-        # Configure executors
+        # Configure executors - jobs are coroutines run directly on the
+        # application's event loop, so async resources (HTTP pools,
+        # the fetch semaphore) are shared across runs
         executors = {
-            'default': ThreadPoolExecutor(max_workers=settings.MAX_CONCURRENT_FETCHES * 2)
+            'default': AsyncIOExecutor(),
+            # Small pool for the synchronous maintenance jobs (batched DB
+            # deletes) so they never block the event loop
+            'blocking': ThreadPoolExecutor(max_workers=2)
         }
 
         # Job defaults
@@ -63,7 +85,7 @@ class SchedulerService:
 
         logger.info("Scheduler initialized successfully")
 
-    def start(self):
+    async def start(self):
         """Start the scheduler"""
         if not self.scheduler:
             raise RuntimeError("Scheduler not initialized. Call initialize() first.")
@@ -76,11 +98,15 @@ class SchedulerService:
         self.scheduler.start()
         self.is_running = True
 
+        # Job store writes and the data_sources query are blocking SQLite
+        # I/O, so run them in a worker thread (add_job is thread-safe and
+        # wakes the scheduler on its own loop)
+
         # Add system jobs
-        self._add_system_jobs()
+        await asyncio.to_thread(self._add_system_jobs)
 
         # Load all active data sources and create jobs
-        self._load_data_source_jobs()
+        await asyncio.to_thread(self._load_data_source_jobs)
 
         logger.info("Scheduler started successfully")
 
@@ -98,18 +124,20 @@ class SchedulerService:
         """Add system maintenance jobs"""
         # Daily cleanup job at 2 AM UTC
         self.scheduler.add_job(
-            sync_cleanup_articles_job,
+            cleanup_old_articles_job,
             trigger=CronTrigger(hour=2, minute=0),
             id='cleanup_articles',
+            executor='blocking',
             name='Cleanup Old Articles',
             replace_existing=True
         )
 
         # Daily cache cleanup at 3 AM UTC
         self.scheduler.add_job(
-            sync_cleanup_cache_job,
+            cleanup_old_cache_job,
             trigger=CronTrigger(hour=3, minute=0),
             id='cleanup_cache',
+            executor='blocking',
             name='Cleanup Old Cache',
             replace_existing=True
         )
@@ -117,17 +145,52 @@ class SchedulerService:
         logger.info("System jobs added")
 
     def _load_data_source_jobs(self):
-        """Load all active data sources and create scheduled jobs"""
+        """
+        Reconcile the persisted data source jobs with the data_sources table
+
+        Jobs survive restarts in the job store, so sources may have changed
+        while the app was down: active sources without a job get one, jobs
+        whose trigger or name no longer match their source are replaced, and
+        jobs for sources that are no longer active (or were deleted) are
+        removed. Matching jobs keep their persisted next run time.
+        """
         db = SessionLocal()
         try:
-            sources = db.query(DataSource).filter(
+            # Only the columns needed to build a job; no full ORM objects
+            sources = db.query(
+                DataSource.id,
+                DataSource.name,
+                DataSource.status,
+                DataSource.cron_expression,
+                DataSource.fetch_frequency_minutes,
+                DataSource.last_fetch_timestamp,
+            ).filter(
                 DataSource.status == 'active'
-            ).all()
+            ).yield_per(500)
+
+            # Fetch the stored jobs once instead of probing the store per source
+            existing = {
+                job.id: job for job in self.scheduler.get_jobs()
+                if job.id.startswith('source_')
+            }
 
+            loaded = 0
+            pending = []
             for source in sources:
-                self.add_source_job(source)
+                job = existing.pop(f"source_{source.id}", None)
+                if job is None or not self._job_matches_source(job, source):
+                    pending.append(source)
+                loaded += 1
 
-            logger.info(f"Loaded {len(sources)} data source jobs")
+            # Whatever is left belongs to sources that are no longer active
+            with self._paused():
+                removed = sum(self._discard_job(job_id) for job_id in existing)
+                added = self._bulk_add_source_jobs(pending)
+
+            logger.info(
+                f"Loaded {loaded} data source jobs "
+                f"({added} added or updated, {removed} stale removed)"
+            )
 
         finally:
             db.close()
@@ -139,30 +202,68 @@ class SchedulerService:
         Args:
             source: DataSource model instance
         """
-        job_id = f"source_{source.id}"
-
-        # Remove existing job if present
-        if self.scheduler.get_job(job_id):
-            self.scheduler.remove_job(job_id)
-
-        # Skip if not active
+        # Skip if not active, dropping any job left from when it was
         if source.status != 'active':
+            self._discard_job(f"source_{source.id}")
             logger.info(f"Source {source.id} is not active, skipping job creation")
             return
 
+        # add_job(replace_existing=True) upserts, so no get/remove probe is needed
+        if not self._schedule_source_job(source):
+            # Don't keep running the old schedule when the new one is invalid
+            self._discard_job(f"source_{source.id}")
+
+    def _discard_job(self, job_id: str) -> bool:
+        """Remove a job if it exists; returns whether one was removed"""
+        try:
+            self.scheduler.remove_job(job_id)
+            return True
+        except JobLookupError:
+            return False
+
+    @staticmethod
+    def _source_trigger(source):
+        """
+        Build the trigger for a data source
+
+        Raises:
+            ValueError: If the source's cron expression is invalid
+        """
+        if source.cron_expression:
+            return _parse_cron(source.cron_expression)
+        return IntervalTrigger(minutes=source.fetch_frequency_minutes)
+
+    def _job_matches_source(self, job, source) -> bool:
+        """Whether a stored job's name and trigger are still those of its source"""
+        if job.name != f"Fetch: {source.name}":
+            return False
+        try:
+            trigger = self._source_trigger(source)
+        except ValueError:
+            return False
+        return str(job.trigger) == str(trigger)
+
+    def _build_source_job_kwargs(self, source) -> Optional[dict]:
+        """
+        Build the add_job arguments (trigger, next run time, id, name) for an active data source
+
+        Args:
+            source: DataSource instance or row with id, name, cron_expression,
+                fetch_frequency_minutes and last_fetch_timestamp
+
+        Returns:
+            Job kwargs dict, or None if the source's cron expression is invalid
+        """
         # Determine trigger and next_run_time
         next_run = None
-        if source.cron_expression:
-            try:
-                trigger = CronTrigger.from_crontab(source.cron_expression)
-                trigger_desc = f"cron: {source.cron_expression}"
-            except Exception as e:
-                logger.error(f"Invalid cron expression for source {source.id}: {e}")
-                return
-        else:
+        try:
+            trigger = self._source_trigger(source)
+        except ValueError as e:
+            logger.error(f"Invalid cron expression for source {source.id}: {e}")
+            return None
+
+        if not source.cron_expression:
             interval_minutes = source.fetch_frequency_minutes
-            trigger = IntervalTrigger(minutes=interval_minutes)
-            trigger_desc = f"every {interval_minutes} minutes"
 
             # Calculate the correct next_run_time based on last_fetch_timestamp
             # so that restarts don't push the schedule forward by a full interval
@@ -176,20 +277,78 @@ class SchedulerService:
                 else:
                     next_run = expected_next
 
-        # Add job
         job_kwargs = dict(
             trigger=trigger,
             args=[source.id],
-            id=job_id,
+            id=f"source_{source.id}",
             name=f"Fetch: {source.name}",
-            replace_existing=True,
         )
         if next_run is not None:
             job_kwargs['next_run_time'] = next_run
+        return job_kwargs
+
+    @staticmethod
+    def _describe_trigger(source) -> str:
+        if source.cron_expression:
+            return f"cron: {source.cron_expression}"
+        return f"every {source.fetch_frequency_minutes} minutes"
+
+    def _schedule_source_job(self, source) -> bool:
+        """
+        Add (or replace) the job for an active data source
+
+        Args:
+            source: DataSource instance or row (see _build_source_job_kwargs)
+
+        Returns:
+            False if the source's cron expression is invalid
+        """
+        job_kwargs = self._build_source_job_kwargs(source)
+        if job_kwargs is None:
+            return False
+
+        self.scheduler.add_job(fetch_source_job, replace_existing=True, **job_kwargs)
+
+        logger.info(f"Added job for source {source.id} ({source.name}): {self._describe_trigger(source)}")
+        return True
+
+    def _bulk_add_source_jobs(self, sources: list) -> int:
+        """
+        Add or replace jobs for many data sources in one paused-scheduler pass
 
-        self.scheduler.add_job(sync_fetch_source_job, **job_kwargs)
+        A running scheduler wakes up and recomputes its next wakeup time after
+        every add_job; pausing it for the batch defers that to a single
+        wakeup when it resumes. A source with an invalid cron expression
+        loses any job it had.
 
-        logger.info(f"Added job for source {source.id} ({source.name}): {trigger_desc}")
+        Args:
+            sources: Active sources (DataSource instances or rows)
+
+        Returns:
+            Number of jobs added or replaced
+        """
+        added = 0
+        with self._paused():
+            for source in sources:
+                if self._schedule_source_job(source):
+                    added += 1
+                else:
+                    # Don't keep running an old schedule when the new one is invalid
+                    self._discard_job(f"source_{source.id}")
+        return added
+
+    @contextmanager
+    def _paused(self):
+        """Pause job processing for a batch of job changes (no-op if already paused)"""
+        was_running = self.scheduler.state == STATE_RUNNING
+        if was_running:
+            self.scheduler.pause()
+        try:
+            yield
+        finally:
+            if was_running:
+                # resume() wakes the scheduler once for the whole batch
+                self.scheduler.resume()
 
     def remove_source_job(self, source_id: int):
         """
@@ -198,10 +357,7 @@ class SchedulerService:
         Args:
             source_id: Data source ID
         """
-        job_id = f"source_{source_id}"
-
-        if self.scheduler.get_job(job_id):
-            self.scheduler.remove_job(job_id)
+        if self._discard_job(f"source_{source_id}"):
             logger.info(f"Removed job for source {source_id}")
         else:
             logger.warning(f"Job for source {source_id} not found")
@@ -250,11 +406,22 @@ class SchedulerService:
 
         if job:
             # Modify the job to run immediately once
-            job.modify(next_run_time=datetime.utcnow())
+            job.modify(next_run_time=datetime.now(_UTC))
             logger.info(f"Triggered immediate run for source {source_id}")
         else:
             logger.warning(f"Job for source {source_id} not found")
 
+    @staticmethod
+    def _job_info(job) -> dict:
+        """Format a job for the API (next run time to whole seconds)"""
+        next_run_time = job.next_run_time
+        return {
+            'id': job.id,
+            'name': job.name,
+            'next_run_time': next_run_time.isoformat(timespec='seconds') if next_run_time else None,
+            'trigger': str(job.trigger),
+        }
+
     def get_job_info(self, source_id: int) -> Optional[dict]:
         """
         Get information about a scheduled job
@@ -271,12 +438,7 @@ class SchedulerService:
         if not job:
             return None
 
-        return {
-            'id': job.id,
-            'name': job.name,
-            'next_run_time': job.next_run_time.isoformat() if job.next_run_time else None,
-            'trigger': str(job.trigger),
-        }
+        return self._job_info(job)
 
     def get_all_jobs(self) -> list[dict]:
         """
@@ -285,17 +447,18 @@ class SchedulerService:
         Returns:
             List of job info dicts
         """
-        jobs = self.scheduler.get_jobs()
+        return [self._job_info(job) for job in self.scheduler.get_jobs()]
 
-        return [
-            {
-                'id': job.id,
-                'name': job.name,
-                'next_run_time': job.next_run_time.isoformat() if job.next_run_time else None,
-                'trigger': str(job.trigger),
-            }
-            for job in jobs
-        ]
+    def count_jobs(self) -> tuple[int, int]:
+        """
+        Count scheduled jobs without formatting them
+
+        Returns:
+            (total jobs, data source jobs)
+        """
+        jobs = self.scheduler.get_jobs()
+        source_jobs = sum(1 for job in jobs if job.id.startswith('source_'))
+        return len(jobs), source_jobs
 
 
 # Singleton instance
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from typing import Optional, Literal
 from datetime import datetime
 
@@ -15,8 +15,12 @@ class StockMentionResponse(BaseModel):
     confidence_score: Optional[float] = None
     context_snippet: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_orm_trusted(cls, obj) -> "StockMentionResponse":
+        """Build from a StockMention row without validation (DB data is trusted)"""
+        return cls.model_construct(**{field: getattr(obj, field) for field in cls.model_fields})
 
 
 class NewsArticleResponse(BaseModel):
@@ -36,8 +40,26 @@ class NewsArticleResponse(BaseModel):
     source_name: Optional[str] = None
     source_type: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_orm_trusted(cls, obj) -> "NewsArticleResponse":
+        """Build from a NewsArticle row without validation (DB data is trusted)"""
+        values = {
+            field: getattr(obj, field)
+            for field in cls.model_fields
+            if field != 'stock_mentions'
+        }
+        values['stock_mentions'] = [
+            StockMentionResponse.from_orm_trusted(mention) for mention in obj.stock_mentions
+        ]
+        return cls.model_construct(**values)
+
+
+# Serialize lists of trusted responses straight to JSON bytes in one
+# pydantic-core pass (no model_dump() -> json.dumps round-trip)
+STOCK_MENTION_LIST_ADAPTER = TypeAdapter(list[StockMentionResponse])
+NEWS_ARTICLE_LIST_ADAPTER = TypeAdapter(list[NewsArticleResponse])
 
 
 class NewsArticleListResponse(BaseModel):
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Literal, Any, Optional
+from typing import Literal, Optional
 
 
 class SystemConfigResponse(BaseModel):
@@ -15,7 +15,8 @@ class SystemConfigResponse(BaseModel):
 
 class SystemConfigUpdate(BaseModel):
     """Schema for updating system configuration"""
-    configs: dict[str, Any]
+    # Scalar values only: SystemConfig stores every value as a string
+    configs: dict[str, str | int | float | bool | None]
 
 
 class GlobalPauseUpdate(BaseModel):
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, HttpUrl, field_validator
+from pydantic import BaseModel, ConfigDict, HttpUrl, field_validator
 from typing import Optional, Literal
 from datetime import datetime
 
@@ -56,8 +56,15 @@ class DataSourceResponse(DataSourceBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_db(cls, obj) -> "DataSourceResponse":
+        """Build from a DataSource row without validation (DB CHECK constraints already hold)"""
+        return cls.model_construct(**{field: getattr(obj, field) for field in _DB_FIELDS})
+
+
+_DB_FIELDS = frozenset(DataSourceResponse.model_fields)
 
 
 class DataSourceListResponse(BaseModel):
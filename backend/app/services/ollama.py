@@ -1,27 +1,98 @@
+import asyncio
+import re
+import time
 import httpx
-import json
+import orjson
 from typing import Optional, Dict, Any
 from loguru import logger
 
 from app.config import settings
 
 
+# Markdown code fences LLMs like to wrap JSON output in
+_FENCE_OPEN = re.compile(r'^```(?:json)?\s*')
+_FENCE_CLOSE = re.compile(r'\s*```$')
+
+# Minimum seconds between forwarded pull progress updates of the same status
+PULL_PROGRESS_INTERVAL = 0.25
+
+# Seconds a /api/tags result is reused by check_health and list_models
+TAGS_CACHE_TTL = 1.0
+
+
 class OllamaService:
     """Service for interacting with Ollama API"""
 
     def __init__(self):
         self.base_url = settings.OLLAMA_HOST
         self.timeout = settings.OLLAMA_TIMEOUT
+        self._client: Optional[httpx.AsyncClient] = None
+        self._tags_cache: tuple[float, Optional[list]] = (0.0, None)
+        self._tags_lock = asyncio.Lock()
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use.
+
+        Keeping one client lets every call reuse pooled keep-alive
+        connections to Ollama instead of reconnecting per request.
+        """
+        if self._client is None or self._client.is_closed:
+            pool_size = settings.MAX_CONCURRENT_FETCHES * 2
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=pool_size,
+                    max_keepalive_connections=pool_size
+                )
+            )
+        return self._client
+
+    async def aclose(self):
+        """Close the shared HTTP client (called on application shutdown)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _fetch_tags(self) -> Optional[list]:
+        """
+        Get the installed models from /api/tags, shared by check_health and list_models
+
+        Results (including failures) are reused for TAGS_CACHE_TTL seconds, and
+        concurrent callers wait on the lock for one in-flight request instead of
+        each sending their own.
+
+        Returns:
+            List of model dictionaries, or None if Ollama is unreachable
+        """
+        async with self._tags_lock:
+            fetched_at, models = self._tags_cache
+            if time.monotonic() - fetched_at < TAGS_CACHE_TTL:
+                return models
+
+            try:
+                client = await self._get_client()
+                response = await client.get("/api/tags", timeout=5.0)
+
+                if response.status_code != 200:
+                    logger.error(f"Ollama /api/tags returned {response.status_code}")
+                    models = None
+                else:
+                    models = orjson.loads(response.content).get("models", [])
+            except Exception as e:
+                logger.error(f"Ollama /api/tags request failed: {e}")
+                models = None
+
+            self._tags_cache = (time.monotonic(), models)
+            return models
+
+    def invalidate_tags_cache(self):
+        """Drop the cached /api/tags result (after models are pulled or deleted)"""
+        self._tags_cache = (0.0, None)
 
     async def check_health(self) -> bool:
         """Check if Ollama is accessible"""
-        try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{self.base_url}/api/tags")
-                return response.status_code == 200
-        except Exception as e:
-            logger.error(f"Ollama health check failed: {e}")
-            return False
+        return await self._fetch_tags() is not None
 
     async def generate(
         self,
@@ -72,33 +143,30 @@ class OllamaService:
             if images:
                 payload["images"] = images
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/generate",
-                    json=payload
-                )
-
-                if response.status_code != 200:
-                    logger.error(f"Ollama API error: {response.status_code} - {response.text}")
-                    return None
+            client = await self._get_client()
+            response = await client.post("/api/generate", json=payload)
 
-                result = response.json()
+            if response.status_code != 200:
+                logger.error(f"Ollama API error: {response.status_code} - {response.text}")
+                return None
 
-                # Parse JSON response if format is json
-                if format == "json":
-                    raw = result.get("response", "")
-                    try:
-                        result["response"] = json.loads(raw)
-                    except json.JSONDecodeError:
-                        # LLMs sometimes wrap JSON in markdown fences or add trailing text
-                        cleaned = self._extract_json(raw)
-                        if cleaned is not None:
-                            result["response"] = cleaned
-                        else:
-                            logger.error(f"Failed to parse JSON response: {raw[:500]}")
-                            return None
+            result = orjson.loads(response.content)
 
-                return result
+            # Parse JSON response if format is json
+            if format == "json":
+                raw = result.get("response", "")
+                try:
+                    result["response"] = orjson.loads(raw)
+                except orjson.JSONDecodeError:
+                    # LLMs sometimes wrap JSON in markdown fences or add trailing text
+                    cleaned = self._extract_json(raw)
+                    if cleaned is not None:
+                        result["response"] = cleaned
+                    else:
+                        logger.error(f"Failed to parse JSON response: {raw[:500]}")
+                        return None
+
+            return result
 
         except Exception as e:
             logger.error(f"Error calling Ollama: {e}")
@@ -111,16 +179,14 @@ class OllamaService:
         Handles common LLM issues: markdown fences, leading/trailing text,
         arrays inside objects, etc.
         """
-        import re
-
         # Strip markdown code fences
-        text = re.sub(r'^```(?:json)?\s*', '', text.strip())
-        text = re.sub(r'\s*```$', '', text.strip())
+        text = _FENCE_OPEN.sub('', text.strip(), count=1)
+        text = _FENCE_CLOSE.sub('', text.strip(), count=1)
 
         # Try parsing the cleaned text directly
         try:
-            return json.loads(text)
-        except json.JSONDecodeError:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
             pass
 
         # Try to find the first { or [ and last } or ]
@@ -129,8 +195,8 @@ class OllamaService:
             end = text.rfind(end_char)
             if start != -1 and end != -1 and end > start:
                 try:
-                    return json.loads(text[start:end + 1])
-                except json.JSONDecodeError:
+                    return orjson.loads(text[start:end + 1])
+                except orjson.JSONDecodeError:
                     continue
 
         return None
@@ -142,19 +208,7 @@ class OllamaService:
         Returns:
             List of model dictionaries with name, size, etc.
         """
-        try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{self.base_url}/api/tags")
-
-                if response.status_code != 200:
-                    logger.error(f"Failed to list models: {response.status_code}")
-                    return None
-
-                data = response.json()
-                return data.get("models", [])
-        except Exception as e:
-            logger.error(f"Error listing models: {e}")
-            return None
+        return await self._fetch_tags()
 
     async def pull_model(self, model_name: str):
         """
@@ -164,31 +218,72 @@ class OllamaService:
             model_name: Name of the model to pull
 
         Yields:
-            Progress updates as JSON strings
+            Progress updates as JSON strings. Byte-count updates within one
+            status are throttled to one per PULL_PROGRESS_INTERVAL; status
+            changes, errors and completed layers are always forwarded.
         """
         try:
-            async with httpx.AsyncClient(timeout=600.0) as client:
-                async with client.stream(
-                    "POST",
-                    f"{self.base_url}/api/pull",
-                    json={"name": model_name, "stream": True}
-                ) as response:
-                    if response.status_code != 200:
-                        error_msg = await response.aread()
-                        logger.error(f"Failed to pull model: {response.status_code} - {error_msg}")
-                        yield json.dumps({"error": f"Failed to pull model: {error_msg.decode()}"})
-                        return
-
-                    async for line in response.aiter_lines():
-                        if line:
-                            try:
-                                data = json.loads(line)
-                                yield json.dumps(data)
-                            except json.JSONDecodeError:
-                                logger.warning(f"Failed to parse pull progress: {line}")
+            client = await self._get_client()
+            async with client.stream(
+                "POST",
+                "/api/pull",
+                json={"name": model_name, "stream": True},
+                timeout=600.0
+            ) as response:
+                if response.status_code != 200:
+                    error_msg = await response.aread()
+                    logger.error(f"Failed to pull model: {response.status_code} - {error_msg}")
+                    yield orjson.dumps({"error": f"Failed to pull model: {error_msg.decode()}"}).decode()
+                    return
+
+                buffer = b""
+                pending = None  # Latest throttled update not yet forwarded
+                last_status = None
+                last_emit = 0.0
+
+                async for chunk in response.aiter_bytes(chunk_size=1 << 16):
+                    buffer += chunk
+                    *lines, buffer = buffer.split(b"\n")
+
+                    for line in lines:
+                        if not line.strip():
+                            continue
+                        try:
+                            data = orjson.loads(line)
+                        except orjson.JSONDecodeError:
+                            logger.warning(f"Failed to parse pull progress: {line!r}")
+                            continue
+
+                        now = time.monotonic()
+                        status = data.get("status")
+                        if (
+                            status != last_status
+                            or "error" in data
+                            or data.get("completed") == data.get("total")
+                            or now - last_emit >= PULL_PROGRESS_INTERVAL
+                        ):
+                            # Lines are already JSON, forward them as-is
+                            yield line.decode()
+                            pending = None
+                            last_status = status
+                            last_emit = now
+                        else:
+                            pending = line
+
+                # Ollama newline-terminates every update, but don't drop a final unterminated one
+                if buffer.strip():
+                    try:
+                        orjson.loads(buffer)
+                        pending = buffer
+                    except orjson.JSONDecodeError:
+                        logger.warning(f"Failed to parse pull progress: {buffer!r}")
+                if pending is not None:
+                    yield pending.decode()
         except Exception as e:
             logger.error(f"Error pulling model: {e}")
-            yield json.dumps({"error": str(e)})
+            yield orjson.dumps({"error": str(e)}).decode()
+        finally:
+            self.invalidate_tags_cache()
 
     async def transcribe_audio(
         self,
@@ -217,24 +312,24 @@ class OllamaService:
             # may require a different API endpoint. Adjust based on actual implementation.
             # For now, we'll use a generate call with a transcription prompt
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                # Check if there's a specific transcription endpoint
-                # Otherwise, fall back to using whisper model with generate
-                response = await client.post(
-                    f"{self.base_url}/api/generate",
-                    json={
-                        "model": model,
-                        "prompt": f"Transcribe this audio file: {audio_path}",
-                        "stream": False
-                    }
-                )
-
-                if response.status_code == 200:
-                    result = response.json()
-                    return result.get("response", "")
-                else:
-                    logger.error(f"Transcription failed: {response.status_code}")
-                    return None
+            client = await self._get_client()
+            # Check if there's a specific transcription endpoint
+            # Otherwise, fall back to using whisper model with generate
+            response = await client.post(
+                "/api/generate",
+                json={
+                    "model": model,
+                    "prompt": f"Transcribe this audio file: {audio_path}",
+                    "stream": False
+                }
+            )
+
+            if response.status_code == 200:
+                result = orjson.loads(response.content)
+                return result.get("response", "")
+            else:
+                logger.error(f"Transcription failed: {response.status_code}")
+                return None
 
         except Exception as e:
             logger.error(f"Error transcribing audio: {e}")
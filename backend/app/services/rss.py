@@ -14,19 +14,187 @@ Known RSS feeds:
         - https://www.marketwatch.com/rss/marketpulse
 """
 
+import asyncio
 import aiohttp
 import feedparser
-from typing import Optional, Dict, Any, List
+from functools import lru_cache
+from io import BytesIO
+from typing import Optional, Dict, Any, List, Tuple
 from loguru import logger
-from datetime import datetime
+from datetime import datetime, timezone
+from urllib.parse import urlparse
+from dateutil import parser as date_parser, tz
+from lxml import etree
 
 from app.config import settings
-from app.services.scraping import WebScraperService
+from app.services.cloudflare_bypass import CloudflareBypassService, cloudflare_bypass_service
+from app.services.scraping import web_scraper
+from app.services.youtube import youtube_service
+
+
+# Article pages larger than this are truncated; the article body comes early in
+# the document and anything beyond is mostly scripts and related-content widgets
+_MAX_ARTICLE_BYTES = 2 * 1024 * 1024
+
+# Root tags recognised by the fast parser (RSS 2.0, Atom, RSS 1.0/RDF)
+_FEED_ROOT_MARKERS = (b"<rss", b"<feed", b"<rdf:RDF")
+_ENTRY_TAGS = frozenset({"item", "entry"})
+_FEED_TAGS = frozenset({"channel", "feed"})
+
+
+def _localname(el) -> str:
+    tag = el.tag
+    return tag.rpartition("}")[2] if isinstance(tag, str) else ""
+
+
+def _element_text(el) -> str:
+    return "".join(el.itertext()).strip()
+
+
+def _parse_entry_element(item) -> Dict[str, str]:
+    """Map an <item>/<entry> element onto the fetch_feed() entry fields."""
+    entry = {"title": "", "url": "", "summary": "", "published": "", "author": ""}
+    guid_link = ""
+
+    for child in item:
+        name = _localname(child)
+        if name == "title":
+            entry["title"] = _element_text(child)
+        elif name == "link":
+            href = child.get("href")
+            if href is None:
+                entry["url"] = entry["url"] or _element_text(child)
+            elif not entry["url"] and child.get("rel", "alternate") == "alternate":
+                entry["url"] = href.strip()
+        elif name == "guid":
+            if child.get("isPermaLink", "true") == "true":
+                guid_link = _element_text(child)
+        elif name in ("description", "summary"):
+            entry["summary"] = entry["summary"] or _element_text(child)
+        elif name in ("pubDate", "published", "issued"):
+            entry["published"] = entry["published"] or _element_text(child)
+        elif name in ("author", "creator"):
+            if not entry["author"]:
+                names = [c for c in child if _localname(c) == "name"]
+                entry["author"] = _element_text(names[0] if names else child)
+
+    if not entry["url"] and guid_link.startswith(("http://", "https://")):
+        entry["url"] = guid_link
+    return entry
+
+
+def _fast_parse_feed(raw: bytes) -> Optional[Tuple[str, List[Dict[str, str]]]]:
+    """
+    Stream-parse a well-formed RSS/Atom document with lxml iterparse.
+
+    Builds only the fields fetch_feed() returns and frees each entry as soon
+    as it is read, avoiding feedparser's full data-dict construction.
+
+    Returns:
+        (feed_title, entries), or None if the document isn't a recognised
+        feed or isn't well-formed, in which case feedparser should be used.
+    """
+    prefix = raw[:1024]
+    if not any(marker in prefix for marker in _FEED_ROOT_MARKERS):
+        return None
+
+    feed_title = ""
+    entries = []
+    try:
+        for _, el in etree.iterparse(
+            BytesIO(raw), events=("end",), resolve_entities=False, no_network=True
+        ):
+            name = _localname(el)
+            if name in _ENTRY_TAGS:
+                entries.append(_parse_entry_element(el))
+                el.clear()
+                # Drop already-processed siblings so memory stays flat
+                while el.getprevious() is not None:
+                    del el.getparent()[0]
+            elif name == "title" and not feed_title:
+                parent = el.getparent()
+                if parent is not None and _localname(parent) in _FEED_TAGS:
+                    feed_title = _element_text(el)
+    except etree.XMLSyntaxError:
+        return None
+
+    if not entries:
+        return None
+    return feed_title, entries
+
+
+# US zone abbreviations seen in RSS pubDates; dateutil ignores unknown ones
+_US_TZINFOS = {
+    "EST": tz.gettz("America/New_York"),
+    "EDT": tz.gettz("America/New_York"),
+    "CST": tz.gettz("America/Chicago"),
+    "CDT": tz.gettz("America/Chicago"),
+    "MST": tz.gettz("America/Denver"),
+    "MDT": tz.gettz("America/Denver"),
+    "PST": tz.gettz("America/Los_Angeles"),
+    "PDT": tz.gettz("America/Los_Angeles"),
+}
+
+
+@lru_cache(maxsize=4096)
+def _parse_published(value: str) -> Optional[datetime]:
+    """
+    Parse an RSS/Atom date string into a naive UTC datetime.
+
+    Cached because entries in one feed often share minute-granularity
+    timestamps, and the same feeds are re-fetched on every run.
+    """
+    if not value:
+        return None
+    try:
+        parsed = date_parser.parse(value, tzinfos=_US_TZINFOS)
+    except (ValueError, OverflowError):
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
 
 
 class RSSService:
     """Service for fetching and parsing RSS feeds."""
 
+    def __init__(self):
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_lock = asyncio.Lock()
+        # feed_url -> validators and parsed result of the last 200 response
+        self._feed_cache: Dict[str, Dict[str, Any]] = {}
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared aiohttp session, creating it on first use.
+
+        Reusing one session keeps connections (and TLS sessions) alive
+        across feed and article fetches to the same hosts.
+        """
+        if self._session is not None and not self._session.closed:
+            return self._session
+
+        async with self._session_lock:
+            if self._session is None or self._session.closed:
+                connector = aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=10,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60,
+                    enable_cleanup_closed=True,
+                )
+                self._session = aiohttp.ClientSession(
+                    connector=connector,
+                    timeout=aiohttp.ClientTimeout(total=settings.RSS_REQUEST_TIMEOUT),
+                )
+            return self._session
+
+    async def aclose(self):
+        """Close the shared session (called on application shutdown)."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
     async def fetch_feed(self, feed_url: str) -> Dict[str, Any]:
         """
         Fetch and parse an RSS feed.
@@ -36,59 +204,106 @@ class RSSService:
 
         Returns:
             Dictionary with status, entries list, and feed metadata.
-            Each entry has: title, url, summary, published, author
+            Each entry has: title, url, summary, published, author, plus
+            published_at (ISO-8601, UTC) and published_ts (UTC epoch), which
+            are None when the date is missing or unparseable
         """
         try:
             logger.info(f"Fetching RSS feed: {feed_url}")
 
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    "User-Agent": "Mozilla/5.0 (compatible; StockNewsBot/1.0)",
-                    "Accept": "application/rss+xml, application/xml, text/xml, */*",
-                }
-                async with session.get(
-                    feed_url,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=settings.RSS_REQUEST_TIMEOUT),
-                ) as response:
-                    if response.status != 200:
-                        logger.error(f"RSS feed returned HTTP {response.status}: {feed_url}")
-                        return {
-                            "status": "error",
-                            "error": f"HTTP {response.status}",
-                            "entries": [],
-                        }
-
-                    content = await response.text()
-
-            # Parse the feed
-            feed = feedparser.parse(content)
-
-            if feed.bozo and not feed.entries:
-                logger.error(f"RSS feed parse error: {feed.bozo_exception}")
-                return {
-                    "status": "error",
-                    "error": f"Parse error: {feed.bozo_exception}",
-                    "entries": [],
-                }
+            session = await self._get_session()
+            headers = {
+                "User-Agent": "Mozilla/5.0 (compatible; StockNewsBot/1.0)",
+                "Accept": "application/rss+xml, application/xml, text/xml, */*",
+            }
+            cached = self._feed_cache.get(feed_url)
+            if cached:
+                if cached["etag"]:
+                    headers["If-None-Match"] = cached["etag"]
+                if cached["last_modified"]:
+                    headers["If-Modified-Since"] = cached["last_modified"]
+
+            async with session.get(feed_url, headers=headers) as response:
+                if response.status == 304 and cached:
+                    logger.info(f"RSS feed not modified, reusing {len(cached['entries'])} cached entries: {feed_url}")
+                    return {
+                        "status": "success",
+                        "feed_title": cached["feed_title"],
+                        # Copies: callers add keys to and truncate the entries
+                        "entries": [dict(entry) for entry in cached["entries"]],
+                    }
+
+                if response.status != 200:
+                    logger.error(f"RSS feed returned HTTP {response.status}: {feed_url}")
+                    return {
+                        "status": "error",
+                        "error": f"HTTP {response.status}",
+                        "entries": [],
+                    }
+
+                # Raw bytes: feedparser sniffs the encoding from the XML
+                # declaration / BOM itself, so decoding to str first is wasted work
+                content = await response.read()
+                content_type = response.headers.get("Content-Type", "")
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+
+            # Parse the feed: fast path for well-formed RSS/Atom, feedparser
+            # for everything else (malformed XML, exotic formats)
+            fast = _fast_parse_feed(content)
+            if fast is not None:
+                feed_title, parsed_entries = fast
+            else:
+                # The charset from Content-Type lets feedparser decode on the
+                # first try instead of probing candidate encodings
+                feed = feedparser.parse(
+                    content,
+                    response_headers={"content-type": content_type} if content_type else None,
+                )
 
-            entries = []
-            for entry in feed.entries:
-                parsed_entry = {
-                    "title": entry.get("title", ""),
-                    "url": entry.get("link", ""),
-                    "summary": entry.get("summary", ""),
-                    "published": entry.get("published", ""),
-                    "author": entry.get("author", ""),
-                }
-                if parsed_entry["url"]:
-                    entries.append(parsed_entry)
+                if feed.bozo and not feed.entries:
+                    logger.error(f"RSS feed parse error: {feed.bozo_exception}")
+                    return {
+                        "status": "error",
+                        "error": f"Parse error: {feed.bozo_exception}",
+                        "entries": [],
+                    }
+
+                feed_title = feed.feed.get("title", "")
+                parsed_entries = [
+                    {
+                        "title": entry.get("title", ""),
+                        "url": entry.get("link", ""),
+                        "summary": entry.get("summary", ""),
+                        "published": entry.get("published", ""),
+                        "author": entry.get("author", ""),
+                    }
+                    for entry in feed.entries
+                ]
+
+            entries = [entry for entry in parsed_entries if entry["url"]]
+            for entry in entries:
+                published_at = _parse_published(entry["published"])
+                entry["published_at"] = published_at.isoformat() if published_at else None
+                entry["published_ts"] = (
+                    published_at.replace(tzinfo=timezone.utc).timestamp() if published_at else None
+                )
 
             logger.info(f"RSS feed parsed: {len(entries)} entries from {feed_url}")
 
+            if etag or last_modified:
+                self._feed_cache[feed_url] = {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "feed_title": feed_title,
+                    "entries": [dict(entry) for entry in entries],
+                }
+            else:
+                self._feed_cache.pop(feed_url, None)
+
             return {
                 "status": "success",
-                "feed_title": feed.feed.get("title", ""),
+                "feed_title": feed_title,
                 "entries": entries,
             }
 
@@ -110,9 +325,6 @@ class RSSService:
         except ImportError:
             return None
 
-        from app.services.cloudflare_bypass import cloudflare_bypass_service
-        from urllib.parse import urlparse
-
         domain = urlparse(entry_url).netloc
         cached = cloudflare_bypass_service.get_cached_cookies(domain)
 
@@ -153,6 +365,11 @@ class RSSService:
                     )
                     return None
 
+                if len(response.content) > _MAX_ARTICLE_BYTES:
+                    # Already downloaded, but bound the parse cost downstream
+                    return response.content[:_MAX_ARTICLE_BYTES].decode(
+                        response.encoding or "utf-8", errors="replace"
+                    )
                 return response.text
 
         except Exception as e:
@@ -162,29 +379,48 @@ class RSSService:
     async def _aiohttp_fetch(self, entry_url: str) -> Optional[str]:
         """Fallback: fetch HTML using aiohttp (original method)."""
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    "User-Agent": (
-                        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                        "AppleWebKit/537.36 (KHTML, like Gecko) "
-                        "Chrome/131.0.0.0 Safari/537.36"
-                    ),
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                    "Accept-Language": "en-US,en;q=0.9",
-                }
-                async with session.get(
-                    entry_url,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=settings.RSS_REQUEST_TIMEOUT),
-                    allow_redirects=True,
-                ) as response:
-                    if response.status != 200:
-                        logger.debug(
-                            f"aiohttp lightweight fetch HTTP {response.status}: "
-                            f"{entry_url}"
-                        )
-                        return None
-                    return await response.text()
+            session = await self._get_session()
+            headers = {
+                "User-Agent": (
+                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                    "AppleWebKit/537.36 (KHTML, like Gecko) "
+                    "Chrome/131.0.0.0 Safari/537.36"
+                ),
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Language": "en-US,en;q=0.9",
+            }
+            async with session.get(
+                entry_url,
+                headers=headers,
+                allow_redirects=True,
+            ) as response:
+                if response.status != 200:
+                    logger.debug(
+                        f"aiohttp lightweight fetch HTTP {response.status}: "
+                        f"{entry_url}"
+                    )
+                    return None
+
+                if (response.content_length or 0) > _MAX_ARTICLE_BYTES:
+                    logger.debug(
+                        f"aiohttp lightweight fetch truncating {response.content_length} "
+                        f"byte page: {entry_url}"
+                    )
+
+                # Stream with an upper bound instead of buffering the whole body
+                chunks = []
+                total = 0
+                async for chunk in response.content.iter_chunked(65536):
+                    chunks.append(chunk)
+                    total += len(chunk)
+                    if total >= _MAX_ARTICLE_BYTES:
+                        break
+
+                body = b"".join(chunks)[:_MAX_ARTICLE_BYTES]
+                try:
+                    return body.decode(response.charset or "utf-8", errors="replace")
+                except LookupError:  # Unknown charset label in Content-Type
+                    return body.decode("utf-8", errors="replace")
 
         except Exception as e:
             logger.debug(f"aiohttp lightweight fetch error: {e}")
@@ -221,17 +457,14 @@ class RSSService:
                 return None
 
             # Check for Cloudflare challenge page disguised as 200
-            from app.services.cloudflare_bypass import CloudflareBypassService
             if CloudflareBypassService.is_cloudflare_block(html=html):
                 logger.debug(
                     f"Lightweight fetch got Cloudflare challenge for {entry_url}"
                 )
                 return None
 
-            # Reuse the scraping service's HTML parsing
-            scraper = WebScraperService()
-            metadata = scraper.extract_metadata(html)
-            article_content = scraper.extract_article_content(html)
+            # Reuse the scraping service's HTML parsing, off the event loop
+            metadata, article_content = await web_scraper.extract_page_async(html)
 
             # If extracted content is too short, signal fallback to browser
             if not article_content or len(article_content) < 200:
@@ -253,6 +486,71 @@ class RSSService:
             logger.debug(f"Lightweight fetch error: {e}")
             return None
 
+    async def fetch_feed_with_content(
+        self,
+        feed_url: str,
+        max_articles: Optional[int],
+        concurrency: int = settings.RSS_FETCH_CONCURRENCY,
+    ) -> Dict[str, Any]:
+        """
+        Fetch an RSS feed and the lightweight content of its top entries.
+
+        Article fetches run concurrently, bounded by a semaphore, so wall
+        time scales with ceil(N / concurrency) round-trips instead of N.
+        YouTube video entries are not prefetched; the article fetcher
+        extracts their transcripts instead.
+
+        Args:
+            feed_url: URL of the RSS feed
+            max_articles: Number of entries to keep and fetch
+                (None = settings.MAX_ARTICLES_PER_SOURCE)
+            concurrency: Maximum simultaneous article fetches
+
+        Returns:
+            fetch_feed() result with entries truncated to max_articles. Each
+            entry gains a "content" key holding the fetch_entry_content()
+            result, or None if the lightweight fetch failed or was skipped.
+        """
+        result = await self.fetch_feed(feed_url)
+        if result["status"] != "success":
+            return result
+
+        # Never prefetch a whole feed
+        if max_articles is None:
+            max_articles = settings.MAX_ARTICLES_PER_SOURCE
+        entries = result["entries"][:max(max_articles, 0)]
+
+        for entry in entries:
+            entry["content"] = None
+        to_fetch = [
+            entry for entry in entries
+            if not youtube_service.is_video_url(entry["url"])
+        ]
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _fetch_one(entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await self.fetch_entry_content(entry["url"])
+
+        contents = await asyncio.gather(
+            *(_fetch_one(entry) for entry in to_fetch),
+            return_exceptions=True,
+        )
+
+        for entry, content in zip(to_fetch, contents):
+            if not isinstance(content, BaseException):
+                entry["content"] = content
+
+        fetched = sum(1 for entry in entries if entry["content"])
+        logger.info(
+            f"RSS prefetch: {fetched}/{len(to_fetch)} articles fetched without a browser "
+            f"({len(entries) - len(to_fetch)} YouTube videos left to the transcript fetcher)"
+        )
+
+        result["entries"] = entries
+        return result
+
 
 # Singleton instance
 rss_service = RSSService()
@@ -1,37 +1,176 @@
 from playwright.async_api import async_playwright, Page, Browser, BrowserContext
-from bs4 import BeautifulSoup
-from typing import Optional, Dict, Any, List
+from lxml import etree, html as lxml_html
+from typing import Optional, Dict, Any, List, Set, Tuple
 from loguru import logger
+import orjson
+import pybase64
 import asyncio
 import random
+from functools import partial
 from datetime import datetime
+from types import MappingProxyType
+from urllib.parse import urlparse
 
 from app.config import settings
+from app.services.cloudflare_bypass import CloudflareBypassService, cloudflare_bypass_service
 from app.services.stealth import get_combined_stealth_script
-from app.services.user_agents import get_random_user_agent
+from app.services.user_agents import get_next_user_agent
 from app.services.human_behavior import simulate_human_behavior
 
 
+# Elements whose text is never article content
+_NOISE_TAGS = ('script', 'style', 'nav', 'footer', 'header', 'aside')
+
+
+def _class_xpath(class_name: str) -> str:
+    """XPath equivalent of the CSS class selector .class_name"""
+    return f"//*[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+
+# Compiled once and evaluated by libxml2
+_META_XPATH = etree.XPath('//meta')
+_TITLE_XPATH = etree.XPath('(//title)[1]')
+# Standard meta tags, keyed by their name= or property= value, in output order;
+# only the first tag with a given name/property counts
+_META_NAMES = ('description', 'keywords', 'author', 'publish_date')
+_META_PROPERTIES = ('article:published_time', 'article:author')
+_META_KEYS = _META_NAMES + _META_PROPERTIES
+# Article containers in priority order (article, [role="main"], .article-content,
+# .post-content, .entry-content, .content, main), as (xpath, element test) pairs
+_ARTICLE_SELECTORS = [
+    ('//article', lambda el: el.tag == 'article'),
+    ('//*[@role="main"]', lambda el: el.get('role') == 'main'),
+    *(
+        (_class_xpath(name), lambda el, name=name: name in (el.get('class') or '').split())
+        for name in ('article-content', 'post-content', 'entry-content', 'content')
+    ),
+    ('//main', lambda el: el.tag == 'main'),
+]
+# All candidates in one document pass; priority is re-applied in _article_candidates
+_ARTICLE_XPATH = etree.XPath(' | '.join(xpath for xpath, _ in _ARTICLE_SELECTORS))
+
+
+def _article_candidates(tree) -> list:
+    """First match of each article selector, in selector priority order"""
+    firsts = [None] * len(_ARTICLE_SELECTORS)
+    for element in _ARTICLE_XPATH(tree):
+        for i, (_, matches) in enumerate(_ARTICLE_SELECTORS):
+            if firsts[i] is None and matches(element):
+                firsts[i] = element
+    return [element for element in firsts if element is not None]
+
+
+def _parse_html(html: str) -> Optional[lxml_html.HtmlElement]:
+    """Parse an HTML document with lxml; None if there is nothing to parse"""
+    if not html or not html.strip():
+        return None
+    try:
+        return lxml_html.document_fromstring(html)
+    except ValueError:
+        # lxml refuses str input that carries an XML encoding declaration
+        return lxml_html.document_fromstring(html.encode('utf-8'))
+    except etree.ParserError:
+        return None
+
+
+def _clean_text(node) -> str:
+    """Text of node without noise elements, whitespace-joined like BS4's get_text(' ', strip=True)"""
+    for element in list(node.iterdescendants(*_NOISE_TAGS)):
+        # Emptied rather than removed so the tail text stays a separate string
+        element.clear(keep_tail=True)
+    return ' '.join(text for text in (part.strip() for part in node.itertext()) if text)
+
+
+# Browser-like headers sent with every request of a context
+_CONTEXT_HEADERS = MappingProxyType({
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'Cache-Control': 'max-age=0',
+})
+
+# Resource types article extraction never needs; aborted to save bandwidth and load time
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font', 'stylesheet', 'texttrack', 'manifest'})
+
+
+# Removes elements that carry no extractable text before the DOM is serialized
+_PRUNE_DOM_JS = """
+() => {
+    for (const el of document.querySelectorAll(
+        'script, style, svg, iframe, img, picture, video, audio, source, link[rel="preload"]'
+    )) {
+        el.remove();
+    }
+}
+"""
+
+# Clicks the first visible cookie-accept button; returns what matched, or null
+_COOKIE_CLICK_JS = """
+([texts, selectors]) => {
+    const visible = (el) => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+    const buttons = Array.from(document.querySelectorAll('button, [role="button"]')).filter(visible);
+    for (const text of texts) {
+        const needle = text.toLowerCase();
+        const button = buttons.find((b) => (b.innerText || b.textContent || '').toLowerCase().includes(needle));
+        if (button) {
+            button.click();
+            return `button:has-text("${text}")`;
+        }
+    }
+    for (const selector of selectors) {
+        const el = document.querySelector(selector);
+        if (el && visible(el)) {
+            el.click();
+            return selector;
+        }
+    }
+    return null;
+}
+"""
+
+
+def _cookie_click_script(texts: List[str], selectors: List[str]) -> str:
+    """Bind the candidate lists into _COOKIE_CLICK_JS so they aren't re-sent per page"""
+    return f"() => ({_COOKIE_CLICK_JS.strip()})({orjson.dumps([texts, selectors]).decode()})"
+
+
 class WebScraperService:
     """Service for web scraping using Playwright with anti-bot evasion"""
 
-    # Common cookie banner selectors
-    COOKIE_SELECTORS = [
+    # Idle pages kept open for reuse, and scrapes served before a page is recycled
+    PAGE_POOL_SIZE = settings.MAX_CONCURRENT_FETCHES
+    # Browser identities (UA + proxy) scrapes are spread across; one is
+    # recycled on its own when a site blocks it
+    CONTEXT_POOL_SIZE = settings.BROWSER_CONTEXT_POOL_SIZE
+    PAGE_MAX_USES = 20
+
+    # Cookie banner accept buttons, by label (case-insensitive substring match,
+    # same as Playwright's :has-text) and then by CSS selector, in priority order
+    COOKIE_BUTTON_TEXTS = [
         # Generic
-        'button:has-text("Accept")',
-        'button:has-text("Accept All")',
-        'button:has-text("I Accept")',
-        'button:has-text("I Agree")',
-        'button:has-text("Agree")',
-        'button:has-text("OK")',
-        'button:has-text("Got it")',
-        'button:has-text("Allow")',
-        'button:has-text("Allow All")',
+        'Accept',
+        'Accept All',
+        'I Accept',
+        'I Agree',
+        'Agree',
+        'OK',
+        'Got it',
+        'Allow',
+        'Allow All',
         # German
-        'button:has-text("Akzeptieren")',
-        'button:has-text("Alle akzeptieren")',
-        'button:has-text("Einverstanden")',
-        'button:has-text("Zustimmen")',
+        'Akzeptieren',
+        'Alle akzeptieren',
+        'Einverstanden',
+        'Zustimmen',
+    ]
+    COOKIE_SELECTORS = [
         # Common class names
         '.accept-cookies',
         '.cookie-accept',
@@ -41,6 +180,9 @@ class WebScraperService:
         '[data-testid="cookie-accept"]',
         '[data-testid="accept-all"]',
     ]
+    _COOKIE_CLICK_SCRIPT = _cookie_click_script(COOKIE_BUTTON_TEXTS, COOKIE_SELECTORS)
+    # Seconds; a busy page shouldn't hold up the scrape over a cookie banner
+    COOKIE_CHECK_TIMEOUT = 0.5
 
     def __init__(self):
         self.browser: Optional[Browser] = None
@@ -48,6 +190,17 @@ class WebScraperService:
         self._playwright = None
         self._proxy_pool: List[Dict[str, str]] = []
         self._proxy_index: int = 0
+        self._host_locks: Dict[str, asyncio.Lock] = {}
+        # Warm pages kept open between scrapes, and how many scrapes each has served
+        self._idle_pages: List[Page] = []
+        # self.context is always slot 0; the others are created on demand
+        self._contexts: List[BrowserContext] = []
+        self._context_index: int = 0
+        self._context_lock = asyncio.Lock()
+        self._page_uses: Dict[Page, int] = {}
+        # Pooled pages currently scraping with heavy resources blocked
+        self._blocking_pages: Set[Page] = set()
+        self._host_last_request: Dict[str, float] = {}
         self._build_proxy_pool()
 
     def _build_proxy_pool(self):
@@ -86,11 +239,11 @@ class WebScraperService:
 
     async def _create_context(self) -> BrowserContext:
         """Create a new browser context with UA, proxy, and stealth settings."""
-        # Pick user agent matched to browser engine
+        # Rotate user agents round-robin, matched to the browser engine
         if settings.USER_AGENT_ROTATION:
-            user_agent = get_random_user_agent(settings.BROWSER_ENGINE)
+            user_agent = get_next_user_agent(settings.BROWSER_ENGINE)
         else:
-            user_agent = get_random_user_agent("chromium")
+            user_agent = get_next_user_agent("chromium")
 
         # Build proxy config
         proxy = self._get_next_proxy()
@@ -100,19 +253,7 @@ class WebScraperService:
             viewport={'width': 1920, 'height': 1080},
             locale='en-US',
             proxy=proxy,
-            extra_http_headers={
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'none',
-                'Sec-Fetch-User': '?1',
-                'Cache-Control': 'max-age=0',
-            },
+            extra_http_headers=_CONTEXT_HEADERS,
         )
 
         # Inject stealth scripts before any page scripts run
@@ -123,6 +264,25 @@ class WebScraperService:
         logger.debug(f"Browser context created (UA: {user_agent[:60]}..., proxy: {'yes' if proxy else 'no'})")
         return context
 
+    async def _throttle_host(self, url: str):
+        """
+        Space out page loads to the same host by SCRAPER_MIN_HOST_INTERVAL.
+
+        Only waits when the host was hit recently, so uncontended hosts
+        are navigated to immediately.
+        """
+        host = urlparse(url).hostname or ''
+        lock = self._host_locks.setdefault(host, asyncio.Lock())
+        loop = asyncio.get_running_loop()
+
+        async with lock:
+            last = self._host_last_request.get(host)
+            if last is not None:
+                delay = last + settings.SCRAPER_MIN_HOST_INTERVAL - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            self._host_last_request[host] = loop.time()
+
     async def _wait_for_challenge(self, page: Page, timeout: int = 15000) -> bool:
         """Wait for a JS challenge page (e.g. DataDome, Cloudflare) to resolve.
 
@@ -157,7 +317,6 @@ class WebScraperService:
         # Check page HTML for Cloudflare challenge markers
         try:
             html = await page.content()
-            from app.services.cloudflare_bypass import CloudflareBypassService
             return CloudflareBypassService.is_cloudflare_block(html=html)
         except Exception:
             return False
@@ -166,6 +325,7 @@ class WebScraperService:
         self,
         url: str,
         take_screenshot: bool = False,
+        return_html: bool = True,
     ) -> Optional[Dict[str, Any]]:
         """
         Try fetching with nodriver when Playwright is blocked by Cloudflare.
@@ -175,8 +335,6 @@ class WebScraperService:
         if not settings.CLOUDFLARE_BYPASS_ENABLED or not settings.NODRIVER_ENABLED:
             return None
 
-        from app.services.cloudflare_bypass import cloudflare_bypass_service
-
         logger.info(f"Escalating to nodriver (Tier 2) for {url}")
         result = await cloudflare_bypass_service.nodriver_fetch(url)
 
@@ -185,20 +343,11 @@ class WebScraperService:
 
         html = result["html"]
 
-        # Parse the nodriver HTML through our standard extractors
-        metadata = self.extract_metadata(html)
-        article_content = self.extract_article_content(html)
+        # Run the nodriver HTML through our standard extractors (these
+        # already fall back to the cleaned <body> text)
+        metadata, article_content = await self.extract_page_async(html)
         raw_content = article_content or ""
 
-        # If we still got no useful content, strip HTML for raw text
-        if not raw_content or len(raw_content) < 100:
-            soup = BeautifulSoup(html, "lxml")
-            body = soup.find("body")
-            if body:
-                for tag in body(["script", "style", "nav", "footer", "header", "aside"]):
-                    tag.decompose()
-                raw_content = body.get_text(separator=" ", strip=True)
-
         if not raw_content or len(raw_content) < 50:
             logger.warning(f"nodriver fetched {url} but content too short")
             return None
@@ -210,21 +359,119 @@ class WebScraperService:
         return {
             "status": "success",
             "url": url,
-            "raw_html": html,
+            "raw_html": html if return_html else None,
             "raw_content": raw_content,
             "metadata": metadata,
             "screenshot": None,
             "fetched_at": datetime.utcnow().isoformat(),
         }
 
-    async def _recreate_context(self):
-        """Close old context and create a new one with fresh UA/proxy."""
-        if self.context:
+    async def _pick_context(self) -> BrowserContext:
+        """Next context in round-robin order, growing the pool up to CONTEXT_POOL_SIZE."""
+        async with self._context_lock:
+            # initialize() may have replaced the primary context
+            if not self._contexts:
+                self._contexts.append(self.context)
+            elif self._contexts[0] is not self.context:
+                self._drop_page_pool(self._contexts[0])
+                self._contexts[0] = self.context
+
+            if len(self._contexts) < self.CONTEXT_POOL_SIZE:
+                context = await self._create_context()
+                self._contexts.append(context)
+                return context
+
+            context = self._contexts[self._context_index % len(self._contexts)]
+            self._context_index += 1
+            return context
+
+    async def _acquire_page(self, context: BrowserContext) -> Page:
+        """Reuse an idle page from the given context, or open a new one."""
+        for i in range(len(self._idle_pages) - 1, -1, -1):
+            page = self._idle_pages[i]
+            if page.context is context:
+                del self._idle_pages[i]
+                if not page.is_closed():
+                    return page
+                self._page_uses.pop(page, None)
+
+        page = await context.new_page()
+        self._page_uses[page] = 0
+        # Installed once per page lifetime; toggled per scrape via _blocking_pages
+        if settings.BLOCK_HEAVY_RESOURCES:
+            await page.route("**/*", partial(self._route_request, page))
+        return page
+
+    async def _route_request(self, page: Page, route):
+        """Abort heavy resource requests for pages in _blocking_pages."""
+        if page in self._blocking_pages and route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _release_page(self, page: Page):
+        """Return a page to the pool, or close it once it is worn out or the pool is full."""
+        self._blocking_pages.discard(page)
+        uses = self._page_uses.get(page, 0) + 1
+        reusable = (
+            not page.is_closed()
+            and any(page.context is context for context in self._contexts)
+            and uses < self.PAGE_MAX_USES
+            and len(self._idle_pages) < self.PAGE_POOL_SIZE
+        )
+
+        if reusable:
+            try:
+                # Drop the previous document so it doesn't hold memory while idle
+                await page.goto("about:blank")
+                self._page_uses[page] = uses
+                self._idle_pages.append(page)
+                return
+            except Exception as e:
+                logger.debug(f"Could not recycle page, closing it: {e}")
+
+        await self._close_page(page)
+
+    async def _close_page(self, page: Page):
+        """Close a page for good (challenge pages are never pooled)."""
+        self._page_uses.pop(page, None)
+        self._blocking_pages.discard(page)
+        try:
+            await page.close()
+        except Exception:
+            pass
+
+    def _drop_page_pool(self, context: Optional[BrowserContext] = None):
+        """Forget pooled pages of a context, or of all contexts (closing a context closes its pages)."""
+        if context is None:
+            self._idle_pages.clear()
+            self._page_uses.clear()
+            self._blocking_pages.clear()
+            return
+
+        self._idle_pages = [page for page in self._idle_pages if page.context is not context]
+        for page in [page for page in self._page_uses if page.context is context]:
+            del self._page_uses[page]
+        self._blocking_pages = {page for page in self._blocking_pages if page.context is not context}
+
+    async def _recycle_context(self, context: BrowserContext):
+        """Replace one blocked context with a fresh UA/proxy identity, leaving the others running."""
+        async with self._context_lock:
+            slot = next((i for i, c in enumerate(self._contexts) if c is context), None)
+            if slot is None and context is not self.context:
+                return  # Already recycled by a concurrent scrape
+
+            self._drop_page_pool(context)
             try:
-                await self.context.close()
+                await context.close()
             except Exception:
                 pass
-        self.context = await self._create_context()
+
+            new_context = await self._create_context()
+            if slot is not None:
+                self._contexts[slot] = new_context
+            if context is self.context:
+                self.context = new_context
 
     async def initialize(self):
         """Initialize Playwright browser with configured engine."""
@@ -263,6 +510,10 @@ class WebScraperService:
 
     async def close(self):
         """Close browser"""
+        self._drop_page_pool()
+        for context in self._contexts[1:]:
+            await context.close()
+        self._contexts = []
         if self.context:
             await self.context.close()
         if self.browser:
@@ -280,113 +531,151 @@ class WebScraperService:
         Returns:
             True if banner was handled, False otherwise
         """
-        for selector in self.COOKIE_SELECTORS:
-            try:
-                button = page.locator(selector).first
-                if await button.is_visible(timeout=2000):
-                    await button.click()
-                    logger.info(f"Clicked cookie banner with selector: {selector}")
-                    await page.wait_for_timeout(1000)  # Wait for banner to close
-                    return True
-            except Exception:
-                continue
+        # One in-page pass over all candidates instead of a locator round-trip
+        # (and visibility check) per selector
+        try:
+            matched = await asyncio.wait_for(
+                page.evaluate(self._COOKIE_CLICK_SCRIPT), self.COOKIE_CHECK_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            logger.debug("Cookie banner check timed out")
+            return False
+        except Exception as e:
+            logger.debug(f"Cookie banner check failed: {e}")
+            return False
+
+        if not matched:
+            return False
+
+        logger.info(f"Clicked cookie banner with selector: {matched}")
+        await page.wait_for_timeout(1000)  # Wait for banner to close
+        return True
 
-        return False
+    @staticmethod
+    def parse_html(html: str) -> Optional[lxml_html.HtmlElement]:
+        """
+        Parse HTML once so extract_metadata and extract_article_content can share the tree
+
+        Args:
+            html: Raw HTML content
 
-    def extract_metadata(self, html: str) -> Dict[str, Any]:
+        Returns:
+            lxml document tree, or None for empty input
+        """
+        return _parse_html(html)
+
+    def extract_metadata(self, html: Optional[str] = None, tree=None) -> Dict[str, Any]:
         """
         Extract metadata from HTML (Open Graph, meta tags, etc.)
 
         Args:
             html: Raw HTML content
+            tree: Tree from parse_html(), used instead of parsing html
 
         Returns:
             Dictionary of metadata
         """
-        soup = BeautifulSoup(html, 'lxml')
+        if tree is None:
+            tree = _parse_html(html)
         metadata = {}
-
-        # Open Graph tags
-        og_tags = soup.find_all('meta', property=lambda x: x and x.startswith('og:'))
-        for tag in og_tags:
-            property_name = tag.get('property', '').replace('og:', '')
-            content = tag.get('content', '')
-            if property_name and content:
-                metadata[f'og_{property_name}'] = content
+        if tree is None:
+            return metadata
+
+        # One pass over all <meta> tags, routed by property / name
+        standard = {}
+        for tag in _META_XPATH(tree):
+            property_value = tag.get('property')
+            if property_value is not None:
+                if property_value.startswith('og:'):
+                    # Open Graph tags
+                    property_name = property_value.replace('og:', '')
+                    content = tag.get('content', '')
+                    if property_name and content:
+                        metadata[f'og_{property_name}'] = content
+                elif property_value in _META_PROPERTIES:
+                    standard.setdefault(property_value, tag.get('content', ''))
+
+            name = tag.get('name')
+            if name in _META_NAMES:
+                standard.setdefault(name, tag.get('content', ''))
 
         # Standard meta tags
-        meta_tags = {
-            'description': soup.find('meta', {'name': 'description'}),
-            'keywords': soup.find('meta', {'name': 'keywords'}),
-            'author': soup.find('meta', {'name': 'author'}),
-            'publish_date': soup.find('meta', {'name': 'publish_date'}),
-            'article:published_time': soup.find('meta', {'property': 'article:published_time'}),
-            'article:author': soup.find('meta', {'property': 'article:author'}),
-        }
-
-        for key, tag in meta_tags.items():
-            if tag:
-                content = tag.get('content', '')
-                if content:
-                    metadata[key] = content
+        for key in _META_KEYS:
+            if standard.get(key):
+                metadata[key] = standard[key]
 
         # Title
-        title_tag = soup.find('title')
-        if title_tag:
-            metadata['page_title'] = title_tag.get_text().strip()
+        title_tags = _TITLE_XPATH(tree)
+        if title_tags:
+            metadata['page_title'] = title_tags[0].text_content().strip()
 
         return metadata
 
-    def extract_article_content(self, html: str) -> Optional[str]:
+    def extract_article_content(self, html: Optional[str] = None, tree=None) -> Optional[str]:
         """
         Extract main article content from HTML
 
+        Strips script/style/nav/footer/header/aside elements from the tree,
+        so when sharing a tree call extract_metadata first.
+
         Args:
             html: Raw HTML content
+            tree: Tree from parse_html(), used instead of parsing html
 
         Returns:
             Extracted text content or None
         """
-        soup = BeautifulSoup(html, 'lxml')
+        if tree is None:
+            tree = _parse_html(html)
+        if tree is None:
+            return None
 
         # Try common article selectors
-        article_selectors = [
-            'article',
-            '[role="main"]',
-            '.article-content',
-            '.post-content',
-            '.entry-content',
-            '.content',
-            'main',
-        ]
-
-        for selector in article_selectors:
-            article = soup.select_one(selector)
-            if article:
-                # Remove script and style tags
-                for tag in article(['script', 'style', 'nav', 'footer', 'header', 'aside']):
-                    tag.decompose()
-
-                text = article.get_text(separator=' ', strip=True)
-                if len(text) > 100:  # Minimum content length
-                    return text
+        for candidate in _article_candidates(tree):
+            text = _clean_text(candidate)
+            if len(text) > 100:  # Minimum content length
+                return text
 
         # Fallback: get body text
-        body = soup.find('body')
-        if body:
-            for tag in body(['script', 'style', 'nav', 'footer', 'header', 'aside']):
-                tag.decompose()
-            return body.get_text(separator=' ', strip=True)
+        body = tree.find('body')
+        if body is not None:
+            return _clean_text(body)
 
         return None
 
+    def extract_page(self, html: str) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        Parse HTML once and extract both metadata and article content
+
+        Args:
+            html: Raw HTML content
+
+        Returns:
+            Tuple of (metadata, article content or None)
+        """
+        tree = _parse_html(html)
+        # Metadata first: content extraction strips noise elements from the tree
+        metadata = self.extract_metadata(tree=tree)
+        return metadata, self.extract_article_content(tree=tree)
+
+    async def extract_page_async(self, html: str) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        extract_page() in a worker thread
+
+        Parsing a large page takes tens of milliseconds of CPU; lxml releases
+        the GIL while parsing, so other fetches keep progressing meanwhile.
+        """
+        return await asyncio.to_thread(self.extract_page, html)
+
     async def scrape_url(
         self,
         url: str,
         wait_for_selector: Optional[str] = None,
         timeout: int = 30000,
         take_screenshot: bool = False,
-        retry_on_403: bool = True
+        retry_on_403: bool = True,
+        return_html: bool = True,
+        lean_html: bool = False
     ) -> Dict[str, Any]:
         """
         Scrape a URL and extract content
@@ -397,16 +686,26 @@ class WebScraperService:
             timeout: Timeout in milliseconds
             take_screenshot: Whether to take a screenshot (for vision models)
             retry_on_403: Whether to retry with delays on 403 errors
+            return_html: Include the page HTML as raw_html (None otherwise)
+            lean_html: Strip scripts, styles and media from the DOM before
+                serializing it (smaller raw_html, faster parsing); only for
+                article text extraction, since link extraction and vision
+                analysis need the full document
 
         Returns:
             Dictionary with raw_html, raw_content, metadata, screenshot, and status
         """
         await self.initialize()
 
-        page = await self.context.new_page()
+        context = await self._pick_context()
+        page = await self._acquire_page(context)
+
+        # Screenshots for vision models need the page fully rendered
+        if not take_screenshot:
+            self._blocking_pages.add(page)
 
-        # Randomized pre-navigation delay (1-3 seconds)
-        await asyncio.sleep(random.uniform(1.0, 3.0))
+        # Per-host rate limit instead of a fixed pre-navigation delay
+        await self._throttle_host(url)
 
         try:
             # Navigate to URL
@@ -439,10 +738,10 @@ class WebScraperService:
                             f"Cloudflare block detected for {url}, "
                             "escalating to nodriver..."
                         )
-                        await page.close()
+                        await self._close_page(page)
                         page = None
                         nodriver_result = await self._nodriver_fallback(
-                            url, take_screenshot
+                            url, take_screenshot, return_html
                         )
                         if nodriver_result:
                             return nodriver_result
@@ -458,11 +757,14 @@ class WebScraperService:
                     # Non-Cloudflare 403: retry with fresh Playwright context
                     if retry_on_403:
                         logger.info(f"Challenge not resolved, retrying {url} with fresh context...")
-                        await page.close()
+                        await self._close_page(page)
                         page = None
-                        await self._recreate_context()
+                        await self._recycle_context(context)
                         await asyncio.sleep(random.uniform(5.0, 8.0))
-                        return await self.scrape_url(url, wait_for_selector, timeout, take_screenshot, retry_on_403=False)
+                        return await self.scrape_url(
+                            url, wait_for_selector, timeout, take_screenshot,
+                            retry_on_403=False, return_html=return_html, lean_html=lean_html,
+                        )
 
                     # Second Playwright attempt also failed — try nodriver as last resort
                     if settings.CLOUDFLARE_BYPASS_ENABLED and settings.NODRIVER_ENABLED:
@@ -470,10 +772,10 @@ class WebScraperService:
                             f"Playwright retry failed for {url}, "
                             "trying nodriver as last resort..."
                         )
-                        await page.close()
+                        await self._close_page(page)
                         page = None
                         nodriver_result = await self._nodriver_fallback(
-                            url, take_screenshot
+                            url, take_screenshot, return_html
                         )
                         if nodriver_result:
                             return nodriver_result
@@ -517,35 +819,42 @@ class WebScraperService:
                 except Exception as e:
                     logger.warning(f"Timeout waiting for selector {wait_for_selector}: {e}")
 
-            # Randomized post-load wait (2-4s instead of fixed 3s)
-            await page.wait_for_timeout(random.randint(2000, 4000))
+            # Let requests triggered by the cookie click / scrolling settle
+            try:
+                await page.wait_for_load_state('networkidle', timeout=3000)
+            except Exception:
+                pass
 
             # Take screenshot if requested (for vision models)
             screenshot_base64 = None
             if take_screenshot:
                 try:
                     screenshot_bytes = await page.screenshot(full_page=False)
-                    import base64
-                    screenshot_base64 = base64.b64encode(screenshot_bytes).decode('utf-8')
+                    # SIMD-accelerated; returns str directly, no extra decode copy
+                    screenshot_base64 = pybase64.b64encode_as_string(screenshot_bytes)
                     logger.info("Captured screenshot for vision model")
                 except Exception as e:
                     logger.warning(f"Failed to capture screenshot: {e}")
 
-            # Extract content
+            # Extract content locally from the serialized DOM; the article
+            # extractor already falls back to the cleaned <body> text, so no
+            # separate innerText round-trip to the browser is needed
+            if lean_html:
+                # After the screenshot, so the rendered page is unaffected
+                try:
+                    await page.evaluate(_PRUNE_DOM_JS)
+                except Exception as e:
+                    logger.debug(f"DOM pruning failed for {url}: {e}")
             raw_html = await page.content()
-            raw_content = await page.evaluate("() => document.body.innerText")
 
-            # Extract metadata
-            metadata = self.extract_metadata(raw_html)
-
-            # Try to extract article content
-            article_content = self.extract_article_content(raw_html)
+            # Parse and extract off the event loop
+            metadata, article_content = await self.extract_page_async(raw_html)
 
             return {
                 'status': 'success',
                 'url': url,
-                'raw_html': raw_html,
-                'raw_content': article_content or raw_content,
+                'raw_html': raw_html if return_html else None,
+                'raw_content': article_content or '',
                 'metadata': metadata,
                 'screenshot': screenshot_base64,
                 'fetched_at': datetime.utcnow().isoformat()
@@ -563,7 +872,35 @@ class WebScraperService:
 
         finally:
             if page:
-                await page.close()
+                await self._release_page(page)
+
+    async def scrape_many(
+        self,
+        urls: List[str],
+        concurrency: int = settings.MAX_CONCURRENT_FETCHES,
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """
+        Scrape several URLs concurrently in pages of the shared context
+
+        Args:
+            urls: URLs to scrape
+            concurrency: Maximum pages loading at once
+            **kwargs: Passed through to scrape_url
+
+        Returns:
+            scrape_url results, in the same order as urls
+        """
+        # Launch the browser up front so concurrent scrapes don't race to do it
+        await self.initialize()
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _scrape_one(url: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.scrape_url(url, **kwargs)
+
+        return await asyncio.gather(*(_scrape_one(url) for url in urls))
 
 
 # Singleton instance
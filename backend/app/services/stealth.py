@@ -65,17 +65,20 @@ delete window.__pw_manual;
 """
 
 
+_COMBINED_STEALTH_SCRIPT = "\n".join([
+    HIDE_WEBDRIVER,
+    MOCK_PLUGINS,
+    MOCK_LANGUAGES,
+    MOCK_CHROME_RUNTIME,
+    MOCK_PERMISSIONS,
+    DELETE_PLAYWRIGHT_GLOBALS,
+])
+
+
 def get_combined_stealth_script() -> str:
     """
     Returns a single combined JavaScript string with all stealth payloads.
 
     Inject this via context.add_init_script() before navigating to any page.
     """
-    return "\n".join([
-        HIDE_WEBDRIVER,
-        MOCK_PLUGINS,
-        MOCK_LANGUAGES,
-        MOCK_CHROME_RUNTIME,
-        MOCK_PERMISSIONS,
-        DELETE_PLAYWRIGHT_GLOBALS,
-    ])
+    return _COMBINED_STEALTH_SCRIPT
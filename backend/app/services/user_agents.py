@@ -5,6 +5,7 @@ Provides realistic, up-to-date user agent strings for Chrome, Firefox,
 and Safari across Windows, macOS, and Linux.
 """
 
+import itertools
 import random
 from typing import Optional
 
@@ -40,6 +41,16 @@ USER_AGENTS = {
     ],
 }
 
+# Flattened once for engine-less picks
+_ALL_AGENTS = tuple(ua for agents in USER_AGENTS.values() for ua in agents)
+
+# Module-private generator; rotation doesn't touch the global random state
+_RNG = random.Random()
+
+# Round-robin iterators for deterministic rotation
+_UA_CYCLES = {engine: itertools.cycle(tuple(agents)) for engine, agents in USER_AGENTS.items()}
+_ALL_AGENTS_CYCLE = itertools.cycle(_ALL_AGENTS)
+
 
 def get_random_user_agent(browser_engine: Optional[str] = None) -> str:
     """
@@ -53,8 +64,24 @@ def get_random_user_agent(browser_engine: Optional[str] = None) -> str:
         A realistic user agent string.
     """
     if browser_engine and browser_engine in USER_AGENTS:
-        return random.choice(USER_AGENTS[browser_engine])
+        return _RNG.choice(USER_AGENTS[browser_engine])
 
     # Pick from all agents
-    all_agents = [ua for agents in USER_AGENTS.values() for ua in agents]
-    return random.choice(all_agents)
+    return _RNG.choice(_ALL_AGENTS)
+
+
+def get_next_user_agent(browser_engine: Optional[str] = None) -> str:
+    """
+    Get the next user agent in round-robin order, optionally filtered by browser engine.
+
+    Args:
+        browser_engine: One of "chromium", "firefox", "webkit".
+                       If None, cycles through all agents.
+
+    Returns:
+        A realistic user agent string.
+    """
+    if browser_engine and browser_engine in USER_AGENTS:
+        return next(_UA_CYCLES[browser_engine])
+
+    return next(_ALL_AGENTS_CYCLE)
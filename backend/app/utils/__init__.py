@@ -1,7 +1,16 @@
 from app.utils.content_hash import generate_content_hash, normalize_content
-from app.utils.retry import retry_async, retry_decorator
+from app.utils.retry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryBudget,
+    retry_async,
+    retry_decorator,
+)
 
 __all__ = [
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "RetryBudget",
     "generate_content_hash",
     "normalize_content",
     "retry_async",
@@ -1,21 +1,22 @@
-import hashlib
 from typing import Union
 
+from blake3 import blake3
 
-def generate_content_hash(content: Union[str, bytes]) -> str:
+
+def generate_content_hash(content: Union[str, bytes]) -> bytes:
     """
-    Generate SHA-256 hash of content for duplicate detection
+    Generate BLAKE3 hash of content for duplicate detection
 
     Args:
         content: Text or bytes to hash
 
     Returns:
-        Hexadecimal hash string
+        Raw 32-byte digest (stored as a BLOB in content_hash columns)
     """
     if isinstance(content, str):
         content = content.encode('utf-8')
 
-    return hashlib.sha256(content).hexdigest()
+    return blake3(content).digest()
 
 
 def normalize_content(content: str) -> str:
@@ -28,15 +29,21 @@ def normalize_content(content: str) -> str:
     Returns:
         Normalized content
     """
-    # Remove extra whitespace
-    normalized = ' '.join(content.split())
+    # Lowercase, then collapse all whitespace runs (\r, \n, \t included) to
+    # single spaces; split() also drops leading/trailing whitespace
+    return ' '.join(content.lower().split())
+
 
-    # Convert to lowercase for consistent hashing
-    normalized = normalized.lower()
+def sql_content_digest(content: Union[str, bytes, None]) -> Union[bytes, None]:
+    """
+    SQLite user function: normalize text and return its content hash
 
-    # Remove common noise characters
-    noise_chars = ['\r', '\n', '\t']
-    for char in noise_chars:
-        normalized = normalized.replace(char, ' ')
+    Registered on every connection as content_digest(), so migrations can
+    rehash rows in place with a single UPDATE.
+    """
+    if content is None:
+        return None
+    if isinstance(content, bytes):
+        content = content.decode('utf-8', errors='replace')
 
-    return normalized.strip()
+    return generate_content_hash(normalize_content(content))
@@ -2,10 +2,51 @@
 Utility functions for LLM configuration management
 """
 import json
+import re
+import threading
+import time
+from typing import Optional
 from sqlalchemy.orm import Session
 from app.database import SessionLocal
 from app.models import SystemConfig
 
+# The llm_config row changes only through the config API, which invalidates
+# this cache; the TTL bounds staleness for writes made any other way
+CACHE_TTL = 30.0
+
+_cache_lock = threading.Lock()
+_cache: tuple[float, Optional[dict]] = (float('-inf'), None)
+
+
+def _load_llm_config() -> Optional[dict]:
+    """Parsed llm_config value (None if the row doesn't exist), cached for CACHE_TTL seconds"""
+    global _cache
+    with _cache_lock:
+        loaded_at, config_data = _cache
+        if time.monotonic() - loaded_at < CACHE_TTL:
+            return config_data
+
+        db = SessionLocal()
+        try:
+            config = db.query(SystemConfig.value).filter(SystemConfig.key == "llm_config").first()
+            config_data = json.loads(config.value) if config else None
+        finally:
+            db.close()
+
+        _cache = (time.monotonic(), config_data)
+        return config_data
+
+
+def invalidate_llm_config_cache():
+    """Drop the cached llm_config so the next lookup re-reads the database"""
+    global _cache
+    with _cache_lock:
+        _cache = (float('-inf'), None)
+
+
+# Name fragments that mark vision/multimodal models, matched in one scan
+_VISION_MODEL_RE = re.compile(r'vision|visual|multimodal|llava', re.IGNORECASE)
+
 
 def is_vision_model(model_name: str) -> bool:
     """
@@ -20,10 +61,7 @@ def is_vision_model(model_name: str) -> bool:
     if not model_name:
         return False
 
-    model_lower = model_name.lower()
-    vision_keywords = ['vision', 'visual', 'multimodal', 'llava']
-
-    return any(keyword in model_lower for keyword in vision_keywords)
+    return _VISION_MODEL_RE.search(model_name) is not None
 
 
 def get_model_for_step(step_name: str) -> str:
@@ -36,22 +74,16 @@ def get_model_for_step(step_name: str) -> str:
     Returns:
         Model name to use for this step
     """
-    db = SessionLocal()
-    try:
-        config = db.query(SystemConfig).filter(SystemConfig.key == "llm_config").first()
-
-        if not config:
-            # Return default model if config doesn't exist
-            return "llama3.1"
+    config_data = _load_llm_config()
 
-        config_data = json.loads(config.value)
-        model_assignments = config_data.get("model_assignments", {})
+    if config_data is None:
+        # Return default model if config doesn't exist
+        return "llama3.1"
 
-        # Return assigned model or first available model as fallback
-        return model_assignments.get(step_name, config_data.get("available_models", ["llama3.1"])[0])
+    model_assignments = config_data.get("model_assignments", {})
 
-    finally:
-        db.close()
+    # Return assigned model or first available model as fallback
+    return model_assignments.get(step_name, config_data.get("available_models", ["llama3.1"])[0])
 
 
 def get_available_models() -> list[str]:
@@ -61,15 +93,10 @@ def get_available_models() -> list[str]:
     Returns:
         List of available model names
     """
-    db = SessionLocal()
-    try:
-        config = db.query(SystemConfig).filter(SystemConfig.key == "llm_config").first()
-
-        if not config:
-            return ["llama3.1", "mistral", "gemma2"]
+    config_data = _load_llm_config()
 
-        config_data = json.loads(config.value)
-        return config_data.get("available_models", ["llama3.1"])
+    if config_data is None:
+        return ["llama3.1", "mistral", "gemma2"]
 
-    finally:
-        db.close()
+    # Copy: the parsed config is shared through the cache
+    return list(config_data.get("available_models", ["llama3.1"]))
@@ -1,8 +1,193 @@
 import asyncio
+import random
+import time
+from collections import deque
 from typing import Callable, Any, Optional, Type
 from loguru import logger
 from functools import wraps
 
+# Module-private generator for retry jitter
+_RNG = random.Random()
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a function while its circuit breaker is open"""
+
+
+class RetryBudget:
+    """
+    Token bucket capping how many retries may happen per second across callers
+
+    Every retry spends one token; tokens refill at `rate` per second up to
+    `capacity`. When the bucket is empty, callers give up instead of retrying,
+    so a failing upstream isn't hit with an ever-growing wave of retries.
+    """
+
+    def __init__(self, rate: float = 10.0, capacity: float = 20.0, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+
+    def try_spend(self) -> bool:
+        """Take one token if available"""
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+class CircuitBreaker:
+    """
+    Stops calls to an upstream once too many of its recent calls fail
+
+    Closed: calls go through and the outcomes of the last `window` calls are
+    kept. Once at least `min_calls` outcomes are recorded and the share of
+    failures among them reaches `failure_ratio`, the breaker opens and calls
+    fail fast with CircuitOpenError. Once `reset_timeout` seconds have
+    passed, a single probe call is let through (half-open); its success
+    closes the breaker with a clean history, its failure re-opens it.
+    Keep one instance per upstream host.
+    """
+
+    def __init__(
+        self,
+        failure_ratio: float = 0.5,
+        window: int = 20,
+        min_calls: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.failure_ratio = failure_ratio
+        self.min_calls = min_calls
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._outcomes = deque(maxlen=window)  # True for a failure
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def allow_request(self) -> bool:
+        """Whether a call may go through now"""
+        if self._opened_at is None:
+            return True
+        now = self._clock()
+        if now - self._opened_at < self.reset_timeout:
+            return False
+        # Half-open: let one probe through; restarting the timer means a probe
+        # that never reports back just allows another one later
+        self._opened_at = now
+        self._probing = True
+        return True
+
+    def record_success(self):
+        if self._probing:
+            # The probe succeeded: close with a clean history
+            self._outcomes.clear()
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+        elif self._opened_at is None:
+            self._record(False)
+        # Otherwise a call started before the breaker opened; ignore it
+
+    def record_failure(self):
+        if self._probing:
+            # The probe failed: stay open for another reset_timeout
+            self._opened_at = self._clock()
+            self._probing = False
+            return
+        if self._opened_at is not None:
+            return
+        self._record(True)
+
+        calls = len(self._outcomes)
+        if calls >= self.min_calls and self._failures >= self.failure_ratio * calls:
+            logger.warning(f"Circuit breaker opened after {self._failures} failures in the last {calls} calls")
+            self._opened_at = self._clock()
+
+    def _record(self, failed: bool):
+        if len(self._outcomes) == self._outcomes.maxlen and self._outcomes[0]:
+            # The oldest outcome is about to be evicted
+            self._failures -= 1
+        self._outcomes.append(failed)
+        self._failures += failed
+
+
+# Optional process-wide budget for callers that want to share one
+retry_budget = RetryBudget()
+
+
+async def _retry_loop(
+    func: Callable,
+    args: tuple,
+    kwargs: dict,
+    max_attempts: int,
+    delay: float,
+    backoff: float,
+    exceptions: tuple,
+    on_retry: Optional[Callable],
+    max_delay: float,
+    jitter: bool,
+    non_retryable: tuple,
+    budget: Optional[RetryBudget],
+    circuit_breaker: Optional[CircuitBreaker],
+    rng: Optional[random.Random]
+) -> Any:
+    """Retry loop behind retry_async and retry_decorator; calls func(*args, **kwargs)"""
+    current_delay = min(delay, max_delay)
+    last_exception = None
+
+    for attempt in range(1, max_attempts + 1):
+        if circuit_breaker and not circuit_breaker.allow_request():
+            if last_exception is not None:
+                raise last_exception
+            raise CircuitOpenError("Circuit breaker is open, not calling upstream")
+
+        try:
+            result = await func(*args, **kwargs)
+        except exceptions as e:
+            last_exception = e
+            if isinstance(e, non_retryable):
+                # The request itself is at fault; says nothing about the
+                # upstream's health, so the breaker isn't told either way
+                raise
+
+            if circuit_breaker:
+                circuit_breaker.record_failure()
+
+            if attempt >= max_attempts:
+                logger.error(f"All {max_attempts} attempts failed: {e}")
+                raise last_exception
+
+            if budget and not budget.try_spend():
+                logger.error(f"Attempt {attempt}/{max_attempts} failed: {e}. Retry budget exhausted, giving up")
+                raise last_exception
+
+            sleep_for = (rng or _RNG).uniform(0, current_delay) if jitter else current_delay
+            logger.warning(
+                f"Attempt {attempt}/{max_attempts} failed: {e}. "
+                f"Retrying in {sleep_for:.2f}s..."
+            )
+
+            if on_retry:
+                await on_retry(attempt, e)
+
+            await asyncio.sleep(sleep_for)
+            current_delay = min(current_delay * backoff, max_delay)
+        else:
+            if circuit_breaker:
+                circuit_breaker.record_success()
+            return result
+
 
 async def retry_async(
     func: Callable,
@@ -10,54 +195,61 @@ async def retry_async(
     delay: float = 1.0,
     backoff: float = 2.0,
     exceptions: tuple = (Exception,),
-    on_retry: Optional[Callable] = None
+    on_retry: Optional[Callable] = None,
+    max_delay: float = 30.0,
+    jitter: bool = True,
+    non_retryable: tuple = (),
+    budget: Optional[RetryBudget] = None,
+    circuit_breaker: Optional[CircuitBreaker] = None,
+    rng: Optional[random.Random] = None
 ) -> Any:
     """
     Retry an async function with exponential backoff
 
+    With jitter, each sleep is drawn uniformly from [0, current delay] ("full
+    jitter") so callers failing together don't retry in lockstep.
+
     Args:
         func: Async function to retry
         max_attempts: Maximum number of attempts
         delay: Initial delay between retries in seconds
         backoff: Backoff multiplier
         exceptions: Tuple of exceptions to catch
-        on_retry: Optional callback called on retry (receives attempt number and exception)
+        on_retry: Optional callback awaited before each retry's sleep
+            (receives attempt number and exception)
+        max_delay: Upper bound for the backoff delay in seconds
+        jitter: Randomize each sleep between 0 and the current delay
+        non_retryable: Exceptions raised immediately, without retrying
+        budget: Optional retry budget (e.g. the shared retry_budget); when
+            exhausted the last error is raised instead of retrying
+        circuit_breaker: Optional breaker for the upstream being called
+        rng: Random generator for the jitter (seed one for reproducible
+            delays); defaults to a module-private generator
 
     Returns:
         Result of successful function call
 
     Raises:
-        Last exception if all attempts fail
+        Last exception if all attempts fail, or CircuitOpenError if the
+        circuit breaker is open
     """
-    current_delay = delay
-    last_exception = None
-
-    for attempt in range(1, max_attempts + 1):
-        try:
-            return await func()
-        except exceptions as e:
-            last_exception = e
-            logger.warning(
-                f"Attempt {attempt}/{max_attempts} failed: {e}. "
-                f"Retrying in {current_delay}s..."
-            )
-
-            if on_retry:
-                await on_retry(attempt, e)
-
-            if attempt < max_attempts:
-                await asyncio.sleep(current_delay)
-                current_delay *= backoff
-            else:
-                logger.error(f"All {max_attempts} attempts failed")
-                raise last_exception
+    return await _retry_loop(
+        func, (), {}, max_attempts, delay, backoff, exceptions, on_retry,
+        max_delay, jitter, non_retryable, budget, circuit_breaker, rng
+    )
 
 
 def retry_decorator(
     max_attempts: int = 3,
     delay: float = 1.0,
     backoff: float = 2.0,
-    exceptions: tuple = (Exception,)
+    exceptions: tuple = (Exception,),
+    max_delay: float = 30.0,
+    jitter: bool = True,
+    non_retryable: tuple = (),
+    budget: Optional[RetryBudget] = None,
+    circuit_breaker: Optional[CircuitBreaker] = None,
+    rng: Optional[random.Random] = None
 ):
     """
     Decorator for retrying async functions
@@ -67,15 +259,15 @@ def retry_decorator(
         async def my_function():
             ...
     """
+    config = (
+        max_attempts, delay, backoff, exceptions, None,
+        max_delay, jitter, non_retryable, budget, circuit_breaker, rng
+    )
+
     def decorator(func: Callable):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            return await retry_async(
-                lambda: func(*args, **kwargs),
-                max_attempts=max_attempts,
-                delay=delay,
-                backoff=backoff,
-                exceptions=exceptions
-            )
+            # Settings were bound once above; func is called without a wrapping lambda
+            return await _retry_loop(func, args, kwargs, *config)
         return wrapper
     return decorator
@@ -0,0 +1,110 @@
+import json
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.api.v1.articles import router
+from app.database import Base, get_db
+from app.models import DataSource, NewsArticle, StockMention
+from app.schemas import NewsArticleResponse
+
+
+@pytest.fixture
+def client(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'news.db'}")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+
+    with Session() as db:
+        source = DataSource(id=1, name='Example', url='https://example.com', source_type='rss')
+        db.add(source)
+        db.add_all([
+            NewsArticle(
+                id=1, data_source_id=1, url='https://example.com/a', title='With mentions',
+                content='Body', summary='Summary', author='Author',
+                published_date=datetime(2024, 5, 1, 12, 30, 45, 123456),
+                fetched_at=datetime(2024, 5, 1, 13, 0, 0),
+                content_hash=b'\x01' * 32, is_high_impact=True,
+                stock_mentions=[
+                    StockMention(ticker_symbol='AAPL', company_name='Apple', sentiment_score=0.5,
+                                 sentiment_label='positive', confidence_score=0.9),
+                    StockMention(ticker_symbol='MSFT', company_name='Microsoft', sentiment_score=-0.25),
+                ],
+            ),
+            NewsArticle(
+                id=2, data_source_id=1, url='https://example.com/b', title='Without mentions',
+                content='Body', published_date=None,
+                fetched_at=datetime(2024, 5, 2, 8, 15, 0, 500),
+                content_hash=b'\x02' * 32, is_high_impact=False,
+            ),
+            NewsArticle(
+                id=3, data_source_id=1, url='https://example.com/c', title='Unflagged',
+                content='Body', fetched_at=datetime(2024, 5, 3),
+                content_hash=b'\x03' * 32,
+            ),
+        ])
+        db.commit()
+        # Rows written before the column had a default
+        db.execute(text("UPDATE news_articles SET is_high_impact = NULL WHERE id = 3"))
+        db.commit()
+
+    def override_get_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestClient(app), Session
+    engine.dispose()
+
+
+def test_list_articles_matches_response_model(client):
+    client, Session = client
+    response = client.get('/articles/', params={'sort': 'fetched_at', 'order': 'asc'})
+    assert response.status_code == 200
+
+    with Session() as db:
+        articles = db.query(NewsArticle).filter(
+            NewsArticle.is_high_impact.isnot(None)
+        ).order_by(NewsArticle.fetched_at).all()
+        expected = [
+            json.loads(NewsArticleResponse.model_validate(article).model_dump_json())
+            for article in articles
+        ]
+
+    assert [a for a in response.json() if a['id'] != 3] == expected
+
+
+def test_list_articles_json_types(client):
+    client, _ = client
+    articles = {a['id']: a for a in client.get('/articles/').json()}
+
+    assert articles[1]['published_date'] == '2024-05-01T12:30:45.123456'
+    assert articles[1]['fetched_at'] == '2024-05-01T13:00:00'
+    assert articles[1]['is_high_impact'] is True
+    assert [m['ticker_symbol'] for m in articles[1]['stock_mentions']] == ['AAPL', 'MSFT']
+    assert articles[1]['stock_mentions'][1]['sentiment_label'] is None
+    assert articles[1]['source_name'] == 'Example'
+    assert articles[1]['source_type'] == 'rss'
+
+    assert articles[2]['published_date'] is None
+    assert articles[2]['fetched_at'] == '2024-05-02T08:15:00.000500'
+    assert articles[2]['is_high_impact'] is False
+    assert articles[2]['stock_mentions'] == []
+
+    assert articles[3]['is_high_impact'] is False
+
+
+def test_list_articles_ticker_filter_returns_each_article_once(client):
+    client, _ = client
+    articles = client.get('/articles/', params={'ticker': 'aapl'}).json()
+    assert [a['id'] for a in articles] == [1]
+    assert len(articles[0]['stock_mentions']) == 2
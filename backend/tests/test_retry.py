@@ -0,0 +1,268 @@
+import random
+
+import pytest
+
+from app.utils import retry as retry_module
+from app.utils.retry import CircuitBreaker, CircuitOpenError, RetryBudget, retry_async
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record retry sleeps instead of waiting"""
+    recorded = []
+
+    async def fake_sleep(seconds):
+        recorded.append(seconds)
+
+    monkeypatch.setattr(retry_module.asyncio, 'sleep', fake_sleep)
+    return recorded
+
+
+def failing(times: int, exc: Exception = ValueError("boom")):
+    """Async callable that raises `times` times, then returns 'ok'"""
+    calls = {'count': 0}
+
+    async def func():
+        calls['count'] += 1
+        if calls['count'] <= times:
+            raise exc
+        return 'ok'
+
+    func.calls = calls
+    return func
+
+
+# RetryBudget
+
+def test_budget_spends_up_to_capacity_then_refuses():
+    clock = FakeClock()
+    budget = RetryBudget(rate=2.0, capacity=3.0, clock=clock)
+
+    assert [budget.try_spend() for _ in range(4)] == [True, True, True, False]
+
+
+def test_budget_refills_at_rate_up_to_capacity():
+    clock = FakeClock()
+    budget = RetryBudget(rate=2.0, capacity=3.0, clock=clock)
+    for _ in range(3):
+        budget.try_spend()
+
+    clock.advance(0.25)  # half a token
+    assert budget.try_spend() is False
+    clock.advance(0.25)  # one token
+    assert budget.try_spend() is True
+    assert budget.try_spend() is False
+
+    clock.advance(60)  # refill is capped at capacity
+    assert [budget.try_spend() for _ in range(4)] == [True, True, True, False]
+
+
+@pytest.mark.asyncio
+async def test_retry_stops_when_budget_is_exhausted(sleeps):
+    budget = RetryBudget(rate=0.0, capacity=1.0, clock=FakeClock())
+    retries = []
+
+    async def on_retry(attempt, exc):
+        retries.append(attempt)
+
+    func = failing(5)
+    with pytest.raises(ValueError):
+        await retry_async(func, max_attempts=5, jitter=False, budget=budget, on_retry=on_retry)
+
+    # One retry paid for, the second refused before on_retry or a sleep
+    assert func.calls['count'] == 2
+    assert retries == [1]
+    assert sleeps == [1.0]
+
+
+@pytest.mark.asyncio
+async def test_retry_does_not_use_a_budget_by_default(sleeps):
+    func = failing(40)
+    result = await retry_async(func, max_attempts=41, delay=0.0, jitter=False)
+    assert result == 'ok'
+
+
+@pytest.mark.asyncio
+async def test_on_retry_not_called_after_final_attempt(sleeps):
+    retries = []
+
+    async def on_retry(attempt, exc):
+        retries.append(attempt)
+
+    with pytest.raises(ValueError):
+        await retry_async(failing(3), max_attempts=3, jitter=False, on_retry=on_retry)
+
+    assert retries == [1, 2]
+    assert sleeps == [1.0, 2.0]
+
+
+# Jitter
+
+@pytest.mark.asyncio
+async def test_jitter_stays_within_backoff_bounds(sleeps):
+    with pytest.raises(ValueError):
+        await retry_async(
+            failing(10), max_attempts=8, delay=1.0, backoff=2.0, max_delay=10.0,
+            rng=random.Random(1234)
+        )
+
+    caps = [1.0, 2.0, 4.0, 8.0, 10.0, 10.0, 10.0]
+    assert len(sleeps) == len(caps)
+    for slept, cap in zip(sleeps, caps):
+        assert 0.0 <= slept <= cap
+
+
+@pytest.mark.asyncio
+async def test_seeded_rng_makes_jitter_reproducible(sleeps):
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            await retry_async(failing(10), max_attempts=4, rng=random.Random(42))
+
+    assert sleeps[:3] == sleeps[3:]
+
+
+# CircuitBreaker
+
+def make_breaker(clock):
+    return CircuitBreaker(failure_ratio=0.5, window=10, min_calls=4, reset_timeout=30.0, clock=clock)
+
+
+def test_breaker_needs_min_calls_before_opening():
+    breaker = make_breaker(FakeClock())
+    for _ in range(3):
+        breaker.record_failure()
+    assert not breaker.is_open
+
+    breaker.record_failure()
+    assert breaker.is_open
+    assert breaker.allow_request() is False
+
+
+def test_breaker_opens_on_failure_ratio_not_consecutive_failures():
+    breaker = make_breaker(FakeClock())
+    # Alternating outcomes never produce two failures in a row, but half fail
+    for _ in range(2):
+        breaker.record_success()
+        breaker.record_failure()
+    assert breaker.is_open
+
+
+def test_breaker_stays_closed_below_failure_ratio():
+    breaker = make_breaker(FakeClock())
+    for _ in range(20):
+        breaker.record_success()
+        breaker.record_success()
+        breaker.record_failure()
+    assert not breaker.is_open
+
+
+def test_breaker_window_forgets_old_failures():
+    breaker = make_breaker(FakeClock())
+    for _ in range(3):
+        breaker.record_failure()
+    for _ in range(10):
+        breaker.record_success()  # pushes the early failures out of the window
+    for _ in range(4):
+        breaker.record_failure()
+    assert not breaker.is_open  # 4/10
+
+    breaker.record_failure()
+    assert breaker.is_open  # 5/10
+
+
+def test_breaker_half_open_probe_success_closes():
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    for _ in range(4):
+        breaker.record_failure()
+
+    clock.advance(29.9)
+    assert breaker.allow_request() is False
+
+    clock.advance(0.1)
+    assert breaker.allow_request() is True  # the probe
+    assert breaker.allow_request() is False  # only one probe at a time
+
+    breaker.record_success()
+    assert not breaker.is_open
+    assert breaker.allow_request() is True
+
+    # History was cleared: a single failure doesn't re-open it
+    breaker.record_failure()
+    assert not breaker.is_open
+
+
+def test_breaker_half_open_probe_failure_reopens():
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    for _ in range(4):
+        breaker.record_failure()
+
+    clock.advance(30)
+    assert breaker.allow_request() is True
+    breaker.record_failure()
+    assert breaker.is_open
+
+    clock.advance(29.9)
+    assert breaker.allow_request() is False
+    clock.advance(0.1)
+    assert breaker.allow_request() is True
+
+
+def test_breaker_ignores_late_outcomes_while_open():
+    breaker = make_breaker(FakeClock())
+    for _ in range(4):
+        breaker.record_failure()
+
+    # Calls that started before the breaker opened
+    breaker.record_success()
+    assert breaker.is_open
+
+
+@pytest.mark.asyncio
+async def test_retry_fails_fast_while_breaker_is_open(sleeps):
+    breaker = make_breaker(FakeClock())
+    for _ in range(4):
+        breaker.record_failure()
+
+    func = failing(0)
+    with pytest.raises(CircuitOpenError):
+        await retry_async(func, circuit_breaker=breaker)
+    assert func.calls['count'] == 0
+
+
+@pytest.mark.asyncio
+async def test_non_retryable_is_neither_success_nor_failure(sleeps):
+    clock = FakeClock()
+    # Opens only when all of the last 4 calls failed
+    breaker = CircuitBreaker(failure_ratio=1.0, window=4, min_calls=4, reset_timeout=30.0, clock=clock)
+    for _ in range(3):
+        breaker.record_failure()
+
+    func = failing(1, exc=KeyError('bad request'))
+    with pytest.raises(KeyError):
+        await retry_async(func, non_retryable=(KeyError,), circuit_breaker=breaker)
+    assert func.calls['count'] == 1
+    # Not a failure: 3/3 is below min_calls
+    assert not breaker.is_open
+
+    # Not a success either: the window is still all failures
+    breaker.record_failure()
+    assert breaker.is_open
+
+    # A half-open probe that hits a non-retryable error doesn't close it
+    clock.advance(30)
+    with pytest.raises(KeyError):
+        await retry_async(failing(1, exc=KeyError('bad request')), non_retryable=(KeyError,), circuit_breaker=breaker)
+    assert breaker.is_open
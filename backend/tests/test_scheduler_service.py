@@ -0,0 +1,134 @@
+import sys
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.schedulers.base import STATE_RUNNING
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+
+from app.models import DataSource
+from app.scheduler.jobs import fetch_source_job
+from app.scheduler.scheduler_service import SchedulerService
+
+
+def make_source(source_id, cron_expression=None, fetch_frequency_minutes=60, last_fetch_timestamp=None):
+    return SimpleNamespace(
+        id=source_id,
+        name=f"Source {source_id}",
+        status='active',
+        cron_expression=cron_expression,
+        fetch_frequency_minutes=fetch_frequency_minutes,
+        last_fetch_timestamp=last_fetch_timestamp,
+    )
+
+
+@pytest_asyncio.fixture
+async def service(tmp_path):
+    service = SchedulerService()
+    service.scheduler = AsyncIOScheduler(
+        jobstores={'default': SQLAlchemyJobStore(url=f"sqlite:///{tmp_path / 'jobs.db'}")},
+        job_defaults={'coalesce': True, 'max_instances': 1, 'misfire_grace_time': 300},
+        timezone='UTC',
+    )
+    service.scheduler.start()
+    service.is_running = True
+    yield service
+    service.scheduler.shutdown(wait=False)
+
+
+@pytest.mark.asyncio
+async def test_bulk_add_source_jobs_round_trips_through_get_jobs(service, tmp_path):
+    last_fetch = datetime.utcnow() - timedelta(minutes=10)
+    sources = [
+        make_source(1, fetch_frequency_minutes=30, last_fetch_timestamp=last_fetch),
+        make_source(2, cron_expression='0 6 * * *'),
+        make_source(3, fetch_frequency_minutes=15),
+        make_source(4, cron_expression='not a cron'),
+    ]
+
+    assert service._bulk_add_source_jobs(sources) == 3
+    assert service.scheduler.state == STATE_RUNNING
+
+    jobs = {job.id: job for job in service.scheduler.get_jobs()}
+    assert set(jobs) == {'source_1', 'source_2', 'source_3'}
+
+    for source in sources[:3]:
+        job = jobs[f"source_{source.id}"]
+        assert job.func is fetch_source_job
+        assert job.args == (source.id,)
+        assert job.name == f"Fetch: {source.name}"
+        assert job.next_run_time is not None
+        assert job.coalesce is True
+        assert job.max_instances == 1
+        assert job.misfire_grace_time == 300
+
+    assert isinstance(jobs['source_1'].trigger, IntervalTrigger)
+    assert jobs['source_1'].trigger.interval == timedelta(minutes=30)
+    # Interval jobs resume from the last fetch instead of a full interval from now
+    expected = last_fetch + timedelta(minutes=30)
+    assert abs(jobs['source_1'].next_run_time.replace(tzinfo=None) - expected) < timedelta(seconds=1)
+
+    assert isinstance(jobs['source_2'].trigger, CronTrigger)
+    assert str(jobs['source_2'].trigger) == str(CronTrigger.from_crontab('0 6 * * *'))
+
+    # The jobs were persisted, not just held in memory
+    store = SQLAlchemyJobStore(url=f"sqlite:///{tmp_path / 'jobs.db'}")
+    try:
+        assert {job.id for job in store.get_all_jobs()} == set(jobs)
+    finally:
+        store.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_bulk_add_source_jobs_replaces_existing_jobs(service):
+    service._bulk_add_source_jobs([make_source(1, fetch_frequency_minutes=30)])
+    service._bulk_add_source_jobs([make_source(1, fetch_frequency_minutes=90)])
+
+    jobs = service.scheduler.get_jobs()
+    assert [job.id for job in jobs] == ['source_1']
+    assert jobs[0].trigger.interval == timedelta(minutes=90)
+
+
+@pytest.mark.asyncio
+async def test_load_data_source_jobs_reconciles_stored_jobs(service, tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'news.db'}")
+    DataSource.__table__.create(engine)
+    Session = sessionmaker(bind=engine)
+    # app.scheduler re-exports the singleton under the module's name
+    monkeypatch.setattr(sys.modules['app.scheduler.scheduler_service'], 'SessionLocal', Session)
+
+    # Jobs as they were stored before the restart
+    service._bulk_add_source_jobs([
+        make_source(1, fetch_frequency_minutes=30),
+        make_source(2, fetch_frequency_minutes=30),
+        make_source(3, fetch_frequency_minutes=30),
+        make_source(4, fetch_frequency_minutes=30),
+    ])
+    unchanged_next_run = service.scheduler.get_job('source_1').next_run_time
+
+    # Sources as they are now: 1 unchanged, 2 rescheduled, 3 renamed, 4 paused, 5 new
+    with Session() as db:
+        db.add_all([
+            DataSource(id=1, name='Source 1', url='https://example.com/1', source_type='rss', fetch_frequency_minutes=30),
+            DataSource(id=2, name='Source 2', url='https://example.com/2', source_type='rss', cron_expression='0 6 * * *'),
+            DataSource(id=3, name='Renamed', url='https://example.com/3', source_type='rss', fetch_frequency_minutes=30),
+            DataSource(id=4, name='Source 4', url='https://example.com/4', source_type='rss', status='paused'),
+            DataSource(id=5, name='Source 5', url='https://example.com/5', source_type='rss', fetch_frequency_minutes=45),
+        ])
+        db.commit()
+
+    service._load_data_source_jobs()
+
+    jobs = {job.id: job for job in service.scheduler.get_jobs()}
+    assert set(jobs) == {'source_1', 'source_2', 'source_3', 'source_5'}
+    assert jobs['source_1'].next_run_time == unchanged_next_run
+    assert str(jobs['source_2'].trigger) == str(CronTrigger.from_crontab('0 6 * * *'))
+    assert jobs['source_3'].name == 'Fetch: Renamed'
+    assert jobs['source_5'].trigger.interval == timedelta(minutes=45)
+    assert service.scheduler.state == STATE_RUNNING
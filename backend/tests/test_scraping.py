@@ -0,0 +1,62 @@
+from lxml import etree
+
+from app.services.scraping import _ARTICLE_SELECTORS, _article_candidates, _parse_html, web_scraper
+
+# Containers appear in the reverse of their selector priority
+REVERSED_DOCUMENT = """
+<html><body>
+  <main id="main">
+    <div class="content" id="content">
+      <div class="entry-content" id="entry">
+        <div class="post-content" id="post">
+          <div class="x article-content y" id="article-content">
+            <div role="main" id="role-main">
+              <article id="first-article">Article text</article>
+            </div>
+          </div>
+        </div>
+      </div>
+    </div>
+  </main>
+  <article id="second-article">Second</article>
+  <div class="content" id="second-content">Second</div>
+  <div class="contents" id="not-content">Class names match whole words only</div>
+</body></html>
+"""
+
+
+def ids(elements):
+    return [element.get('id') for element in elements]
+
+
+def test_article_candidates_follow_selector_priority_not_document_order():
+    tree = _parse_html(REVERSED_DOCUMENT)
+    assert ids(_article_candidates(tree)) == [
+        'first-article', 'role-main', 'article-content', 'post', 'entry', 'content', 'main',
+    ]
+
+
+def test_article_candidates_match_one_query_per_selector():
+    tree = _parse_html(REVERSED_DOCUMENT)
+    expected = []
+    for xpath, _ in _ARTICLE_SELECTORS:
+        matches = etree.XPath(xpath)(tree)
+        if matches:
+            expected.append(matches[0])
+    assert _article_candidates(tree) == expected
+
+
+def test_article_candidates_skip_missing_selectors():
+    tree = _parse_html('<html><body><main id="m"><p>x</p></main><article id="a">y</article></body></html>')
+    assert ids(_article_candidates(tree)) == ['a', 'm']
+
+
+def test_extract_article_content_prefers_higher_priority_container():
+    body = 'Real article body. ' * 10
+    html = f"""
+    <html><body>
+      <div class="content">{'Sidebar teaser text. ' * 10}</div>
+      <article><p>{body}</p><script>ignored()</script></article>
+    </body></html>
+    """
+    assert web_scraper.extract_article_content(html) == body.strip()